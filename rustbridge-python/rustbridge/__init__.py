@@ -5,6 +5,9 @@ This package provides Python bindings for rustbridge plugins using ctypes.
 It supports JSON-based transport, binary transport for high-performance paths,
 and optional bundle loading with minisign signature verification.
 
+Plugin calls are thread-safe and release the GIL while the plugin runs, so a
+single plugin can serve calls from several Python threads in parallel.
+
 Example:
     # Direct library loading (JSON transport)
     from rustbridge import NativePluginLoader, PluginConfig, LogLevel
@@ -35,21 +38,28 @@ Example:
         response = plugin.call("echo", '{"message": "hello"}')
 """
 
-from rustbridge.core.log_level import LogLevel
-from rustbridge.core.lifecycle_state import LifecycleState
-from rustbridge.core.plugin_exception import PluginException
-from rustbridge.core.plugin_config import PluginConfig
-from rustbridge.core.response_envelope import ResponseEnvelope
-from rustbridge.core.bundle_manifest import BundleManifest, PlatformInfo, SchemaInfo
-from rustbridge.core.bundle_loader import BundleLoader
-from rustbridge.core.minisign_verifier import MinisignVerifier
-from rustbridge.native.structures import FfiBuffer
-from rustbridge.native.native_plugin import NativePlugin
-from rustbridge.native.plugin_loader import NativePluginLoader
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rustbridge.core.bundle_loader import BundleLoader
+    from rustbridge.core.bundle_manifest import BundleManifest, PlatformInfo, SchemaInfo
+    from rustbridge.core.lifecycle_state import LifecycleState
+    from rustbridge.core.log_level import LogLevel
+    from rustbridge.core.minisign_verifier import MinisignVerifier
+    from rustbridge.core.plugin_config import PluginConfig
+    from rustbridge.core.plugin_exception import PluginException
+    from rustbridge.core.response_envelope import ResponseEnvelope
+    from rustbridge.native.library import clear_library_cache
+    from rustbridge.native.native_plugin import NativePlugin
+    from rustbridge.native.plugin_loader import NativePluginLoader
+    from rustbridge.native.structures import FfiBuffer
 
 __version__ = "0.7.0"
 
-__all__ = [
+__all__ = (
     # Core types
     "LogLevel",
     "LifecycleState",
@@ -66,4 +76,37 @@ __all__ = [
     "FfiBuffer",
     "NativePlugin",
     "NativePluginLoader",
-]
+    "clear_library_cache",
+)
+
+# Public names are imported on first access (PEP 562), so `import rustbridge` does not
+# pull in ctypes, zipfile or PyNaCl until the corresponding class is actually used.
+_LAZY_IMPORTS = {
+    "LogLevel": "rustbridge.core.log_level",
+    "LifecycleState": "rustbridge.core.lifecycle_state",
+    "PluginException": "rustbridge.core.plugin_exception",
+    "PluginConfig": "rustbridge.core.plugin_config",
+    "ResponseEnvelope": "rustbridge.core.response_envelope",
+    "BundleManifest": "rustbridge.core.bundle_manifest",
+    "PlatformInfo": "rustbridge.core.bundle_manifest",
+    "SchemaInfo": "rustbridge.core.bundle_manifest",
+    "BundleLoader": "rustbridge.core.bundle_loader",
+    "MinisignVerifier": "rustbridge.core.minisign_verifier",
+    "FfiBuffer": "rustbridge.native.structures",
+    "NativePlugin": "rustbridge.native.native_plugin",
+    "NativePluginLoader": "rustbridge.native.plugin_loader",
+    "clear_library_cache": "rustbridge.native.library",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,21 @@
 """Core types for rustbridge Python bindings."""
 
-from rustbridge.core.log_level import LogLevel
-from rustbridge.core.lifecycle_state import LifecycleState
-from rustbridge.core.plugin_exception import PluginException
-from rustbridge.core.plugin_config import PluginConfig
-from rustbridge.core.response_envelope import ResponseEnvelope
-from rustbridge.core.bundle_manifest import BundleManifest, PlatformInfo, SchemaInfo
-from rustbridge.core.bundle_loader import BundleLoader
-from rustbridge.core.minisign_verifier import MinisignVerifier
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rustbridge.core.bundle_loader import BundleLoader
+    from rustbridge.core.bundle_manifest import BundleManifest, PlatformInfo, SchemaInfo
+    from rustbridge.core.lifecycle_state import LifecycleState
+    from rustbridge.core.log_level import LogLevel
+    from rustbridge.core.minisign_verifier import MinisignVerifier
+    from rustbridge.core.plugin_config import PluginConfig
+    from rustbridge.core.plugin_exception import PluginException
+    from rustbridge.core.response_envelope import ResponseEnvelope
+
+__all__ = (
     "LogLevel",
     "LifecycleState",
     "PluginException",
@@ -20,4 +26,32 @@ __all__ = [
     "SchemaInfo",
     "BundleLoader",
     "MinisignVerifier",
-]
+)
+
+# Imported on first access (PEP 562) so that importing one core module does not load
+# the bundle loader and PyNaCl as a side effect.
+_LAZY_IMPORTS = {
+    "LogLevel": "rustbridge.core.log_level",
+    "LifecycleState": "rustbridge.core.lifecycle_state",
+    "PluginException": "rustbridge.core.plugin_exception",
+    "PluginConfig": "rustbridge.core.plugin_config",
+    "ResponseEnvelope": "rustbridge.core.response_envelope",
+    "BundleManifest": "rustbridge.core.bundle_manifest",
+    "PlatformInfo": "rustbridge.core.bundle_manifest",
+    "SchemaInfo": "rustbridge.core.bundle_manifest",
+    "BundleLoader": "rustbridge.core.bundle_loader",
+    "MinisignVerifier": "rustbridge.core.minisign_verifier",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
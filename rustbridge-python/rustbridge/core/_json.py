@@ -0,0 +1,122 @@
+"""JSON parsing and serialization shared by the plugin, response and manifest code."""
+
+from __future__ import annotations
+
+import codecs
+import enum
+import json
+import sys
+from typing import Any
+
+# orjson (optional, `pip install rustbridge[fast]`) parses str, bytes or a memoryview
+# directly in C and is several times faster than the stdlib on response-sized
+# documents.
+try:
+    from orjson import OPT_PASSTHROUGH_DATACLASS, OPT_PASSTHROUGH_DATETIME
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _orjson_loads
+
+    # orjson natively serializes dataclasses and datetimes, which the stdlib rejects.
+    # Passed through (with no default), they raise TypeError and take the stdlib path,
+    # so both paths accept the same values. Non-str keys are left to the stdlib too;
+    # OPT_NON_STR_KEYS would also accept datetime, UUID and Enum keys.
+    _ORJSON_OPTIONS = OPT_PASSTHROUGH_DATACLASS | OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    _orjson_dumps = None
+    _orjson_loads = None
+
+# orjson reads integers outside the 64-bit range as (lossy) floats, while Rust's
+# serde_json writes u128/i128 values as plain integer literals. Documents with a
+# run of 19 or more digits are parsed with the stdlib instead, which keeps every
+# integer exact. The check maps digits to "0" and everything else to " " so the
+# run can be found with a plain substring search, both in C. Buffers other than
+# bytes are mapped with charmap_decode, which reads the buffer in place rather
+# than needing a bytes copy for translate (a regex over the view scans several
+# times slower).
+_DIGIT_MASK = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+_DIGIT_MASK_STR = _DIGIT_MASK.decode("latin-1")
+_LONG_DIGIT_RUN = b"0" * 19
+_LONG_DIGIT_RUN_STR = "0" * 19
+
+
+def _has_long_digit_run(data: str | bytes | bytearray | memoryview) -> bool:
+    """Return whether data contains a run of 19 or more ASCII digits."""
+    if isinstance(data, bytes):
+        return _LONG_DIGIT_RUN in data.translate(_DIGIT_MASK)
+    if isinstance(data, str):
+        return _LONG_DIGIT_RUN in data.encode("utf-8", "surrogatepass").translate(_DIGIT_MASK)
+    return _LONG_DIGIT_RUN_STR in codecs.charmap_decode(data, "strict", _DIGIT_MASK_STR)[0]
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Parse a JSON document, keeping integers of any size exact.
+
+    NaN and Infinity literals are rejected by both parsers, so a parsed document
+    never holds a non-finite float.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        UnicodeDecodeError: If binary input is not valid UTF-8 (stdlib parser only).
+    """
+    if _orjson_loads is not None and not _has_long_digit_run(data):
+        return _orjson_loads(data)
+
+    if isinstance(data, memoryview):
+        data = str(data, "utf-8")
+    text = data
+
+    def reject_constant(name: str) -> Any:
+        doc = text if isinstance(text, str) else str(text, "utf-8", "replace")
+        raise json.JSONDecodeError(f"{name} is not valid JSON", doc, max(doc.find(name), 0))
+
+    return json.loads(data, parse_constant=reject_constant)
+
+
+def _stdlib_default(value: Any) -> Any:
+    """Write UUID and Enum values as orjson does; it has no option to pass them through."""
+    # A UUID can only exist once its module is imported; don't import it here
+    uuid = sys.modules.get("uuid")
+    if uuid is not None and isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, *, parsed: bool = False) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON bytes.
+
+    The output is the same with and without orjson: no whitespace between tokens,
+    non-ASCII characters written as UTF-8 rather than \\u escapes. Only the spelling
+    of float exponents may differ (1e+16 vs 1e16). Both paths accept the same
+    values: besides the JSON types, UUID and Enum values are written as orjson
+    writes them, and dataclasses and datetimes are rejected.
+
+    Args:
+        value: The value to serialize.
+        parsed: The value came from loads(), so it cannot hold NaN or infinities
+            and the check for them is skipped.
+
+    Raises:
+        TypeError: If the value holds an object JSON cannot represent.
+        ValueError: If the value holds a NaN or infinite float.
+    """
+    if _orjson_dumps is not None:
+        try:
+            data = _orjson_dumps(value, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # A value orjson does not handle (e.g. an int beyond 64 bits)
+        else:
+            # orjson writes NaN and infinities as null; only output that contains a
+            # null can hide one, and that is re-checked by the stdlib below
+            if parsed or b"null" not in data:
+                return data
+    return json.dumps(
+        value,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+        default=_stdlib_default,
+    ).encode("utf-8")
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import contextlib
+import errno
+import functools
 import hashlib
+import hmac
+import json
+import mmap
 import os
 import platform
-import stat
+import shutil
+import struct
+import sys
 import tempfile
+import threading
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
-
-from rustbridge.core.bundle_manifest import BundleManifest, BridgeInfo, BuildInfo, SchemaInfo
+from typing import TYPE_CHECKING, BinaryIO
+
+from rustbridge.core._json import loads as _json_loads
+from rustbridge.core.bundle_manifest import (
+    BridgeInfo,
+    BuildInfo,
+    BundleManifest,
+    ExtractEntry,
+    SchemaInfo,
+)
 from rustbridge.core.minisign_verifier import MinisignVerifier
 from rustbridge.core.plugin_exception import PluginException
 
@@ -23,6 +42,181 @@ if TYPE_CHECKING:
 # Type alias for log callback
 LogCallbackFn = Callable[["LogLevel", str, str], None]
 
+# ZIP local file header: signature, fixed fields, then name and extra field lengths
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# errno values meaning "this kernel copy primitive is not usable here, fall back"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Inflated entries are processed in L2-sized chunks: each chunk is hashed and written
+# while still cache resident. ZipExtFile has no native readinto() (the io default
+# reads and then copies), so plain read() calls are the cheapest way to pull chunks.
+_INFLATE_CHUNK_SIZE = 256 * 1024
+
+# Inflate buffers are sized from the entry header up to this limit and grown as data
+# arrives beyond it, so a forged size in an untrusted bundle cannot force a huge
+# allocation up front
+_INFLATE_PREALLOCATE_LIMIT = 64 * 1024 * 1024
+
+# Extracted libraries are created executable; the umask still applies
+_LIBRARY_MODE = 0o755
+
+# Number of manifests (raw and parsed) kept per BundleLoader
+_MANIFEST_CACHE_SIZE = 16
+
+# extract_schemas only fans out to threads when there is enough data to inflate
+# and hash to outweigh starting them; typical schemas are a few KiB.
+_PARALLEL_SCHEMA_BYTES = 1024 * 1024
+_SCHEMA_WORKERS = 8
+
+
+_OS_MAP = {"linux": "linux", "darwin": "darwin", "windows": "windows"}
+_ARCH_MAP = {
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "aarch64": "aarch64",
+    "arm64": "aarch64",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _platform_string(system: str, machine: str) -> str:
+    """Normalize platform.system()/platform.machine() to a bundle platform key."""
+    system = system.lower()
+    machine = machine.lower()
+    return f"{_OS_MAP.get(system, system)}-{_ARCH_MAP.get(machine, machine)}"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_verifier(public_key: str) -> MinisignVerifier:
+    """
+    Return a shared verifier for a public key.
+
+    Verification itself runs in libsodium or OpenSSL; what is cached is the key
+    parsing and backend key setup, which every manifest and library check of a
+    load would otherwise repeat. Verifiers hold no per-call state.
+    """
+    return MinisignVerifier(public_key)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """
+    Copy count bytes starting at offset in src_fd to the current position of dst_fd.
+
+    Uses copy_file_range(2), then sendfile(2) on Linux, so the data never passes
+    through user space; falls back to a read/write loop elsewhere.
+    """
+    end = offset + count
+    copiers: list[Callable[[int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(lambda pos: os.copy_file_range(src_fd, dst_fd, end - pos, pos))
+    if sys.platform.startswith("linux"):
+        copiers.append(lambda pos: os.sendfile(dst_fd, src_fd, pos, end - pos))
+
+    for copy_chunk in copiers:
+        try:
+            while offset < end:
+                copied = copy_chunk(offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+        if offset == end:
+            return
+
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    while offset < end:
+        chunk = os.read(src_fd, min(end - offset, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise PluginException("Unexpected end of bundle while extracting entry")
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        offset += len(chunk)
+
+
+def _entry_data_offset(info: zipfile.ZipInfo, header: bytes) -> int:
+    """Return the offset of an entry's data, given the bytes of its local file header."""
+    if len(header) != _LOCAL_HEADER.size:
+        raise PluginException(f"Truncated local header in bundle: {info.filename}")
+
+    signature, name_length, extra_length = _LOCAL_HEADER.unpack(header)
+    if signature != _LOCAL_HEADER_SIGNATURE:
+        raise PluginException(f"Bad local header in bundle: {info.filename}")
+
+    return info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+
+
+def _create_output(path: Path, mode: int = 0o666) -> BinaryIO:
+    """
+    Create (or truncate) path for writing with the given mode.
+
+    A new file gets its mode at creation (subject to the umask), so no chmod is
+    needed. A file that already existed keeps its mode, as O_TRUNC leaves it; only
+    when mode asks for exec bits (libraries) are they added to it, with a single
+    fchmod on the open descriptor.
+    """
+    flags = os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, mode)
+    except FileExistsError:
+        fd = os.open(path, flags | os.O_TRUNC)
+        exec_bits = mode & 0o111
+        if exec_bits and hasattr(os, "fchmod"):
+            try:
+                os.fchmod(fd, os.fstat(fd).st_mode & 0o7777 | exec_bits)
+            except BaseException:
+                os.close(fd)
+                raise
+    return open(fd, "wb")
+
+
+def _discard_staged(staged: Iterable[tuple[Path, Path]]) -> None:
+    """Remove staging files (from _stage_schema) that were not moved into place."""
+    for staging_path, _ in staged:
+        staging_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _map_file(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """
+    Map a file read-only for a front-to-back pass; empty files, which cannot be
+    mapped, yield b"".
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Hashing reads the whole file once in order: read ahead aggressively
+            # and let pages already hashed be reclaimed first
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map usable as the file object of a ``zipfile.ZipFile``."""
+
+    def seekable(self) -> bool:
+        # mmap only grew seekable() in Python 3.13; zipfile probes for it.
+        return True
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int | None:
+        # A file raises OSError for a position before its start, which zipfile
+        # expects when probing a short file for the end record; mmap raises ValueError
+        try:
+            return super().seek(pos, whence)
+        except ValueError as e:
+            raise OSError(errno.EINVAL, str(e)) from e
+
 
 class BundleLoader:
     """
@@ -50,6 +244,7 @@ class BundleLoader:
         self,
         verify_signatures: bool = True,
         public_key_override: str | None = None,
+        cache_dir: str | Path | None = None,
     ) -> None:
         """
         Create a new BundleLoader.
@@ -57,9 +252,18 @@ class BundleLoader:
         Args:
             verify_signatures: Whether to verify minisign signatures (default: True).
             public_key_override: Optional public key to use instead of manifest's key.
+            cache_dir: Optional directory in which load() and load_with_config() keep
+                extracted libraries, keyed by checksum, for reuse by later loads (see
+                default_cache_dir()). By default every load extracts to a new temp
+                directory.
         """
         self._verify_signatures = verify_signatures
         self._public_key_override = public_key_override
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._manifest_cache: dict[tuple[str, int, int], bytes] = {}
+        self._parsed_manifests: dict[bytes, BundleManifest] = {}
+        self._manifest_cache_lock = threading.Lock()
+        self._open_bundles = threading.local()
 
     def load(self, bundle_path: str | Path) -> "NativePlugin":
         """
@@ -102,23 +306,23 @@ class BundleLoader:
         """
         from rustbridge.native.plugin_loader import NativePluginLoader
 
-        bundle_path = Path(bundle_path)
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
+        if self._cache_dir is not None:
+            with self.open_bundle(bundle_path) as zip_file:
+                lib_path = self._extract_library_cached(zip_file, self._cache_dir)
+            return NativePluginLoader.load_with_config(str(lib_path), config, log_callback)
 
         # Extract library to unique temp directory
         temp_dir = tempfile.mkdtemp(prefix="rustbridge-", dir=tempfile.gettempdir())
         try:
-            lib_path = self._extract_library_internal(
-                bundle_path, Path(temp_dir), fail_if_exists=False
-            )
+            with self.open_bundle(bundle_path) as zip_file:
+                lib_path = self._extract_library_internal(
+                    zip_file, Path(temp_dir), fail_if_exists=False
+                )
             return NativePluginLoader.load_with_config(
                 str(lib_path), config, log_callback
             )
         except Exception:
             # Clean up temp directory on failure
-            import shutil
-
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise
 
@@ -139,15 +343,12 @@ class BundleLoader:
         Raises:
             PluginException: If extraction or verification fails.
         """
-        bundle_path = Path(bundle_path)
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
-
-        # Create unique temp directory under system temp path
-        temp_dir = tempfile.mkdtemp(prefix="rustbridge-", dir=tempfile.gettempdir())
-        return self._extract_library_internal(
-            bundle_path, Path(temp_dir), fail_if_exists=False
-        )
+        with self.open_bundle(bundle_path) as zip_file:
+            # Create unique temp directory under system temp path
+            temp_dir = tempfile.mkdtemp(prefix="rustbridge-", dir=tempfile.gettempdir())
+            return self._extract_library_internal(
+                zip_file, Path(temp_dir), fail_if_exists=False
+            )
 
     def extract_library(self, bundle_path: str | Path, dest_dir: str | Path) -> Path:
         """
@@ -168,17 +369,14 @@ class BundleLoader:
             PluginException: If extraction or verification fails.
             FileExistsError: If the library file already exists at the target path.
         """
-        bundle_path = Path(bundle_path)
         dest_dir = Path(dest_dir)
 
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
-
-        return self._extract_library_internal(bundle_path, dest_dir, fail_if_exists=True)
+        with self.open_bundle(bundle_path) as zip_file:
+            return self._extract_library_internal(zip_file, dest_dir, fail_if_exists=True)
 
     def _extract_library_internal(
         self,
-        bundle_path: Path,
+        zip_file: zipfile.ZipFile,
         dest_dir: Path,
         *,
         fail_if_exists: bool,
@@ -188,7 +386,7 @@ class BundleLoader:
         Internal method to extract the library with configurable overwrite behavior.
 
         Args:
-            bundle_path: Path to the .rbp bundle file.
+            zip_file: The opened bundle (see open_bundle).
             dest_dir: Directory to extract the library to.
             fail_if_exists: If True, raise FileExistsError if file already exists.
             variant: Variant to extract (defaults to platform's default variant).
@@ -196,69 +394,120 @@ class BundleLoader:
         Returns:
             Path to the extracted library file.
         """
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
-            # Load manifest
-            manifest = self._load_manifest(zip_file)
+        # Load manifest
+        manifest, manifest_data = self._load_manifest(zip_file)
 
-            # Verify manifest signature if enabled
-            if self._verify_signatures:
-                self._verify_manifest_signature(zip_file, manifest)
+        # Verify manifest signature if enabled
+        if self._verify_signatures:
+            self._verify_manifest_signature(zip_file, manifest, manifest_data)
 
-            # Detect platform
-            current_platform = self.get_current_platform()
-            platform_info = manifest.get_platform(current_platform)
-            if not platform_info:
-                raise PluginException(f"Platform not supported: {current_platform}")
+        entry, output_path = self._library_target(
+            manifest, dest_dir, fail_if_exists=fail_if_exists, variant=variant
+        )
+        self._extract_verified_entry(
+            zip_file,
+            manifest,
+            entry,
+            output_path,
+            checksum_error=f"Checksum verification failed for {entry.library}",
+        )
+        return output_path
+
+    def _library_target(
+        self,
+        manifest: BundleManifest,
+        dest_dir: Path,
+        *,
+        fail_if_exists: bool,
+        variant: str | None,
+    ) -> tuple[ExtractEntry, Path]:
+        """Resolve the library entry and its output path for this platform."""
+        # Detect platform
+        current_platform = self.get_current_platform()
+        platform_info = manifest.get_platform(current_platform)
+        if not platform_info:
+            raise PluginException(f"Platform not supported: {current_platform}")
 
-            # Get effective variant
+        # Library path and checksum for the variant, resolved when the manifest was parsed
+        entry = platform_info.resolve(variant)
+        if not entry.library:
             effective_variant = variant or platform_info.get_default_variant()
+            raise PluginException(
+                f"Variant '{effective_variant}' not found for platform '{current_platform}'"
+            )
 
-            # Get library path and checksum for the variant
-            library_path = platform_info.get_library(effective_variant)
-            checksum = platform_info.get_checksum(effective_variant)
+        # Determine output path
+        output_path = dest_dir / Path(entry.library).name
 
-            if not library_path:
-                raise PluginException(
-                    f"Variant '{effective_variant}' not found for platform '{current_platform}'"
-                )
-
-            # Read library data
-            lib_data = self._read_zip_entry(zip_file, library_path)
+        # Check if file already exists when user specifies path
+        if fail_if_exists and output_path.exists():
+            raise FileExistsError(
+                f"Library already exists at target path: {output_path}. "
+                "Remove the existing file or use extract_library_to_temp() "
+                "for automatic temp directory."
+            )
 
-            # Verify checksum
-            if not self._verify_checksum(lib_data, checksum):
-                raise PluginException(f"Checksum verification failed for {library_path}")
+        return entry, output_path
 
-            # Verify library signature if enabled
-            if self._verify_signatures:
-                self._verify_library_signature(zip_file, manifest, library_path, lib_data)
-
-            # Determine output path
-            lib_filename = Path(library_path).name
-            output_path = dest_dir / lib_filename
-
-            # Check if file already exists when user specifies path
-            if fail_if_exists and output_path.exists():
-                raise FileExistsError(
-                    f"Library already exists at target path: {output_path}. "
-                    "Remove the existing file or use extract_library_to_temp() "
-                    "for automatic temp directory."
-                )
+    def _extract_library_cached(self, zip_file: zipfile.ZipFile, cache_dir: Path) -> Path:
+        """
+        Extract the library into a content-addressed cache, reusing an earlier extraction.
 
-            # Ensure output directory exists
-            dest_dir.mkdir(parents=True, exist_ok=True)
+        The library lives at <cache_dir>/<sha256>/<filename>. A cached file is
+        verified again before it is reused (but not inflated or rewritten), since
+        the cache outlives this process. New extractions are written to a private
+        temporary name and renamed into place, so concurrent loaders never see a
+        partial file and processes that still map an older file are unaffected.
+        """
+        manifest, manifest_data = self._load_manifest(zip_file)
 
-            # Write the library
-            output_path.write_bytes(lib_data)
+        if self._verify_signatures:
+            self._verify_manifest_signature(zip_file, manifest, manifest_data)
 
-            # Make executable on Unix
-            if os.name != "nt":
-                current_mode = output_path.stat().st_mode
-                output_path.chmod(
-                    current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+        entry, _ = self._library_target(
+            manifest, cache_dir, fail_if_exists=False, variant=None
+        )
+        checksum_error = f"Checksum verification failed for {entry.library}"
+        if entry.checksum_bytes is None:
+            # Not valid hex: nothing could ever match it, and there is no cache key
+            raise PluginException(checksum_error)
+
+        cache_path = cache_dir / entry.checksum_bytes.hex() / Path(entry.library).name
+        if cache_path.is_file():
+            try:
+                self._verify_extracted(
+                    zip_file, manifest, entry, cache_path, None, checksum_error=checksum_error
                 )
+                return cache_path
+            except PluginException:
+                pass  # Damaged or replaced; extract it again below
 
-            return output_path
+        staging_path = cache_path.with_name(
+            f".{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        self._extract_verified_entry(
+            zip_file, manifest, entry, staging_path, checksum_error=checksum_error
+        )
+        try:
+            os.replace(staging_path, cache_path)
+        except BaseException:
+            staging_path.unlink(missing_ok=True)
+            raise
+        return cache_path
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """
+        Return the per-user cache directory for extracted libraries.
+
+        Returns:
+            $XDG_CACHE_HOME/rustbridge, %LOCALAPPDATA%/rustbridge on Windows, or
+            ~/.cache/rustbridge.
+        """
+        base = os.environ.get("XDG_CACHE_HOME")
+        if not base and os.name == "nt":
+            base = os.environ.get("LOCALAPPDATA")
+        return Path(base) / "rustbridge" if base else Path.home() / ".cache" / "rustbridge"
 
     def extract_library_variant(
         self,
@@ -283,15 +532,40 @@ class BundleLoader:
             PluginException: If extraction or verification fails, or variant not found.
             FileExistsError: If the library file already exists at the target path.
         """
-        bundle_path = Path(bundle_path)
         dest_dir = Path(dest_dir)
 
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
+        with self.open_bundle(bundle_path) as zip_file:
+            return self._extract_library_internal(
+                zip_file, dest_dir, fail_if_exists=True, variant=variant
+            )
 
-        return self._extract_library_internal(
-            bundle_path, dest_dir, fail_if_exists=True, variant=variant
-        )
+    def supports_platform(self, bundle_path: str | Path, platform: str | None = None) -> bool:
+        """
+        Check whether a bundle contains a library for a platform.
+
+        Only the platform table of the manifest is inspected, without building the
+        full BundleManifest, which keeps scans over many bundles cheap.
+
+        Args:
+            bundle_path: Path to the .rbp bundle file.
+            platform: Platform string (e.g., "linux-x86_64"). Defaults to current platform.
+
+        Returns:
+            True if the manifest lists a library for the platform.
+
+        Raises:
+            PluginException: If the manifest is missing or not valid JSON.
+        """
+        platform = platform or self.get_current_platform()
+        with self.open_bundle(bundle_path) as zip_file:
+            manifest_data = self._read_zip_entry(zip_file, "manifest.json")
+
+        try:
+            platforms = _json_loads(manifest_data).get("platforms")
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError) as e:
+            raise PluginException(f"Failed to parse manifest JSON: {e}") from e
+
+        return isinstance(platforms, dict) and platform in platforms
 
     def list_variants(self, bundle_path: str | Path, platform: str | None = None) -> list[str]:
         """
@@ -307,7 +581,7 @@ class BundleLoader:
         Raises:
             PluginException: If platform is not supported.
         """
-        manifest = self.get_manifest(bundle_path)
+        manifest = self._cached_manifest(bundle_path)
         platform = platform or self.get_current_platform()
         platform_info = manifest.get_platform(platform)
         if not platform_info:
@@ -325,7 +599,7 @@ class BundleLoader:
         Returns:
             Default variant name (typically "release").
         """
-        manifest = self.get_manifest(bundle_path)
+        manifest = self._cached_manifest(bundle_path)
         platform = platform or self.get_current_platform()
         platform_info = manifest.get_platform(platform)
         if not platform_info:
@@ -355,7 +629,7 @@ class BundleLoader:
         Returns:
             True if the bundle contains at least one JNI bridge library.
         """
-        manifest = self.get_manifest(bundle_path)
+        manifest = self._cached_manifest(bundle_path)
         return (
             manifest.bridges is not None
             and manifest.bridges.jni is not None
@@ -379,15 +653,12 @@ class BundleLoader:
         Raises:
             PluginException: If extraction or verification fails.
         """
-        bundle_path = Path(bundle_path)
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
-
-        # Create unique temp directory under system temp path
-        temp_dir = tempfile.mkdtemp(prefix="rustbridge-", dir=tempfile.gettempdir())
-        return self._extract_jni_bridge_internal(
-            bundle_path, Path(temp_dir), fail_if_exists=False
-        )
+        with self.open_bundle(bundle_path) as zip_file:
+            # Create unique temp directory under system temp path
+            temp_dir = tempfile.mkdtemp(prefix="rustbridge-", dir=tempfile.gettempdir())
+            return self._extract_jni_bridge_internal(
+                zip_file, Path(temp_dir), fail_if_exists=False
+            )
 
     def extract_jni_bridge(self, bundle_path: str | Path, dest_dir: str | Path) -> Path:
         """
@@ -406,17 +677,14 @@ class BundleLoader:
             PluginException: If extraction or verification fails.
             FileExistsError: If the library file already exists at the target path.
         """
-        bundle_path = Path(bundle_path)
         dest_dir = Path(dest_dir)
 
-        if not bundle_path.exists():
-            raise FileNotFoundError(f"Bundle not found: {bundle_path}")
-
-        return self._extract_jni_bridge_internal(bundle_path, dest_dir, fail_if_exists=True)
+        with self.open_bundle(bundle_path) as zip_file:
+            return self._extract_jni_bridge_internal(zip_file, dest_dir, fail_if_exists=True)
 
     def _extract_jni_bridge_internal(
         self,
-        bundle_path: Path,
+        zip_file: zipfile.ZipFile,
         dest_dir: Path,
         *,
         fail_if_exists: bool,
@@ -426,7 +694,7 @@ class BundleLoader:
         Internal method to extract the JNI bridge library.
 
         Args:
-            bundle_path: Path to the .rbp bundle file.
+            zip_file: The opened bundle (see open_bundle).
             dest_dir: Directory to extract the library to.
             fail_if_exists: If True, raise FileExistsError if file already exists.
             variant: Variant to extract (defaults to platform's default variant).
@@ -434,75 +702,143 @@ class BundleLoader:
         Returns:
             Path to the extracted library file.
         """
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
-            # Load manifest
-            manifest = self._load_manifest(zip_file)
+        # Load manifest
+        manifest, manifest_data = self._load_manifest(zip_file)
 
-            # Check if JNI bridge is available
-            if manifest.bridges is None or not manifest.bridges.jni:
-                raise PluginException("Bundle does not contain a JNI bridge library")
+        # Check if JNI bridge is available
+        if manifest.bridges is None or not manifest.bridges.jni:
+            raise PluginException("Bundle does not contain a JNI bridge library")
 
-            # Verify manifest signature if enabled
-            if self._verify_signatures:
-                self._verify_manifest_signature(zip_file, manifest)
+        # Verify manifest signature if enabled
+        if self._verify_signatures:
+            self._verify_manifest_signature(zip_file, manifest, manifest_data)
 
-            # Detect platform
-            current_platform = self.get_current_platform()
-            platform_info = manifest.bridges.jni.get(current_platform)
-            if not platform_info:
-                raise PluginException(
-                    f"JNI bridge not available for platform: {current_platform}"
-                )
+        entry, output_path = self._jni_bridge_target(
+            manifest.bridges, dest_dir, fail_if_exists=fail_if_exists, variant=variant
+        )
+        self._extract_verified_entry(
+            zip_file,
+            manifest,
+            entry,
+            output_path,
+            checksum_error=f"Checksum verification failed for JNI bridge: {entry.library}",
+        )
+        return output_path
+
+    def _jni_bridge_target(
+        self,
+        bridges: BridgeInfo,
+        dest_dir: Path,
+        *,
+        fail_if_exists: bool,
+        variant: str | None,
+    ) -> tuple[ExtractEntry, Path]:
+        """Resolve the JNI bridge entry and its output path for this platform."""
+        # Detect platform
+        current_platform = self.get_current_platform()
+        platform_info = bridges.jni.get(current_platform)
+        if not platform_info:
+            raise PluginException(
+                f"JNI bridge not available for platform: {current_platform}"
+            )
 
-            # Get effective variant
+        # Library path and checksum for the variant, resolved when the manifest was parsed
+        entry = platform_info.resolve(variant)
+        if not entry.library:
             effective_variant = variant or platform_info.get_default_variant()
+            raise PluginException(
+                f"JNI bridge variant '{effective_variant}' not found for platform '{current_platform}'"
+            )
 
-            # Get library path and checksum for the variant
-            library_path = platform_info.get_library(effective_variant)
-            checksum = platform_info.get_checksum(effective_variant)
+        # Determine output path
+        output_path = dest_dir / Path(entry.library).name
 
-            if not library_path:
-                raise PluginException(
-                    f"JNI bridge variant '{effective_variant}' not found for platform '{current_platform}'"
-                )
+        # Check if file already exists when user specifies path
+        if fail_if_exists and output_path.exists():
+            raise FileExistsError(
+                f"JNI bridge already exists at target path: {output_path}. "
+                "Remove the existing file or use extract_jni_bridge_to_temp() "
+                "for automatic temp directory."
+            )
 
-            # Read library data
-            lib_data = self._read_zip_entry(zip_file, library_path)
+        return entry, output_path
 
-            # Verify checksum
-            if not self._verify_checksum(lib_data, checksum):
-                raise PluginException(f"Checksum verification failed for JNI bridge: {library_path}")
+    def extract_all(
+        self, bundle_path: str | Path, dest_dir: str | Path
+    ) -> tuple[Path, Path | None]:
+        """
+        Extract and verify the library and, if present, the JNI bridge in one pass.
 
-            # Verify library signature if enabled
-            if self._verify_signatures:
-                self._verify_library_signature(zip_file, manifest, library_path, lib_data)
-
-            # Determine output path
-            lib_filename = Path(library_path).name
-            output_path = dest_dir / lib_filename
-
-            # Check if file already exists when user specifies path
-            if fail_if_exists and output_path.exists():
-                raise FileExistsError(
-                    f"JNI bridge already exists at target path: {output_path}. "
-                    "Remove the existing file or use extract_jni_bridge_to_temp() "
-                    "for automatic temp directory."
-                )
+        The bundle is opened and its manifest verified once, then both libraries
+        are inflated, hashed and written concurrently. Decompression and hashing
+        release the GIL, so the two pipelines overlap instead of running back to
+        back. If either extraction fails, no extracted file is left behind.
 
-            # Ensure output directory exists
-            dest_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            bundle_path: Path to the .rbp bundle file.
+            dest_dir: Directory to extract the libraries to.
 
-            # Write the library
-            output_path.write_bytes(lib_data)
+        Returns:
+            Tuple of the library path and the JNI bridge path, or None when the
+            bundle has no JNI bridge for the current platform.
 
-            # Make executable on Unix
-            if os.name != "nt":
-                current_mode = output_path.stat().st_mode
-                output_path.chmod(
-                    current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+        Raises:
+            PluginException: If extraction or verification fails, or the library and
+                the JNI bridge have the same file name.
+            FileExistsError: If a library file already exists at the target path.
+        """
+        dest_dir = Path(dest_dir)
+
+        with self.open_bundle(bundle_path) as zip_file:
+            manifest, manifest_data = self._load_manifest(zip_file)
+
+            if self._verify_signatures:
+                self._verify_manifest_signature(zip_file, manifest, manifest_data)
+
+            entry, output_path = self._library_target(
+                manifest, dest_dir, fail_if_exists=True, variant=None
+            )
+            jobs = [(entry, output_path, "Checksum verification failed for ")]
+
+            bridge_output: Path | None = None
+            bridges = manifest.bridges
+            if bridges is not None and self.get_current_platform() in bridges.jni:
+                bridge_entry, bridge_output = self._jni_bridge_target(
+                    bridges, dest_dir, fail_if_exists=True, variant=None
+                )
+                # Both are written concurrently, so they must not share a file (compared
+                # case-insensitively, as on macOS and Windows file systems)
+                if bridge_output.name.casefold() == output_path.name.casefold():
+                    raise PluginException(
+                        f"Library and JNI bridge both extract to {output_path.name}"
+                    )
+                jobs.append(
+                    (bridge_entry, bridge_output, "Checksum verification failed for JNI bridge: ")
                 )
 
-            return output_path
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [
+                    executor.submit(
+                        self._extract_verified_entry,
+                        zip_file,
+                        manifest,
+                        job_entry,
+                        job_output,
+                        checksum_error=error_prefix + job_entry.library,
+                    )
+                    for job_entry, job_output, error_prefix in jobs
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Let the other extraction finish, then remove whatever it wrote
+                    wait(futures)
+                    for _, job_output, _ in jobs:
+                        job_output.unlink(missing_ok=True)
+                    raise
+
+        return output_path, bridge_output
 
     def get_manifest(self, bundle_path: str | Path) -> BundleManifest:
         """
@@ -516,9 +852,37 @@ class BundleLoader:
 
         Raises:
             PluginException: If manifest cannot be read or parsed.
+
+        Note:
+            Manifest bytes are cached per bundle path, modification time and size,
+            so a series of introspection calls on one bundle reads the manifest
+            once. Each call returns a newly parsed BundleManifest that the caller
+            may modify; the loader never uses it.
         """
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
-            return self._load_manifest(zip_file)
+        return BundleManifest.from_bytes(self._read_manifest_bytes(bundle_path))
+
+    def _cached_manifest(self, bundle_path: str | Path) -> BundleManifest:
+        """Return the loader's own parsed manifest of a bundle; never hand it out."""
+        return self._parse_manifest(self._read_manifest_bytes(bundle_path))
+
+    def _read_manifest_bytes(self, bundle_path: str | Path) -> bytes:
+        """Read a bundle's manifest bytes, cached by path, modification time and size."""
+        stat_result = os.stat(bundle_path)
+        key = (os.path.abspath(bundle_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+        manifest_data = self._manifest_cache.get(key)
+        if manifest_data is not None:
+            return manifest_data
+
+        with self.open_bundle(bundle_path) as zip_file:
+            manifest_data = self._read_zip_entry(zip_file, "manifest.json")
+
+        with self._manifest_cache_lock:
+            if len(self._manifest_cache) >= _MANIFEST_CACHE_SIZE:
+                del self._manifest_cache[next(iter(self._manifest_cache))]
+            self._manifest_cache[key] = manifest_data
+
+        return manifest_data
 
     def list_files(self, bundle_path: str | Path) -> list[str]:
         """
@@ -530,7 +894,7 @@ class BundleLoader:
         Returns:
             List of file paths within the bundle.
         """
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
+        with self.open_bundle(bundle_path) as zip_file:
             return zip_file.namelist()
 
     def get_schemas(self, bundle_path: str | Path) -> dict[str, SchemaInfo]:
@@ -563,30 +927,222 @@ class BundleLoader:
         Raises:
             PluginException: If extraction fails or schema not found.
         """
-        bundle_path = Path(bundle_path)
+        with self.open_bundle(bundle_path) as zip_file:
+            return self._extract_schema(zip_file, schema_name, Path(dest_dir))
+
+    def _extract_schema(
+        self, zip_file: zipfile.ZipFile, schema_name: str, dest_dir: Path
+    ) -> Path:
+        """Extract a schema file from an opened bundle."""
+        manifest, _ = self._load_manifest(zip_file)
+
+        schema_info = manifest.schemas.get(schema_name)
+        if not schema_info:
+            raise PluginException(f"Schema not found in bundle: {schema_name}")
+
+        info = self._get_zip_info(zip_file, schema_info.path)
+        return self._write_schema(zip_file, info, schema_name, schema_info, dest_dir)
+
+    def extract_schemas(
+        self,
+        bundle_path: str | Path,
+        dest_dir: str | Path,
+        names: Iterable[str] | None = None,
+    ) -> dict[str, Path]:
+        """
+        Extract several schema files from the bundle in one pass.
+
+        The bundle is opened and its manifest parsed once, and the schemas are
+        read in archive order so the bundle is scanned front to back. When the
+        schemas are large enough for it to pay off, they are inflated, hashed and
+        written on a small thread pool; all three release the GIL. Every schema is
+        verified before any is moved into dest_dir, so if one fails, no file in
+        dest_dir is created or replaced.
+
+        Args:
+            bundle_path: Path to the .rbp bundle file.
+            dest_dir: Directory to extract the schemas to.
+            names: Names of the schemas to extract (default: all schemas).
+
+        Returns:
+            Dictionary mapping schema names to the extracted file paths.
+
+        Raises:
+            PluginException: If extraction fails or a schema is not found.
+        """
         dest_dir = Path(dest_dir)
 
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
-            manifest = self._load_manifest(zip_file)
+        with self.open_bundle(bundle_path) as zip_file:
+            targets = self._schema_targets(zip_file, names)
 
-            schema_info = manifest.schemas.get(schema_name)
+            total_size = sum(info.file_size for info, _, _ in targets)
+            workers = min(len(targets), os.cpu_count() or 1, _SCHEMA_WORKERS)
+            if workers > 1 and total_size >= _PARALLEL_SCHEMA_BYTES:
+                staged = self._stage_schemas_concurrently(zip_file, targets, dest_dir, workers)
+            else:
+                staged = self._stage_schemas(zip_file, targets, dest_dir)
+
+        extracted: dict[str, Path] = {}
+        try:
+            for schema_name, (staging_path, output_path) in staged.items():
+                os.replace(staging_path, output_path)
+                extracted[schema_name] = output_path
+        except BaseException:
+            _discard_staged(staged.values())
+            raise
+
+        return extracted
+
+    def _stage_schemas(
+        self,
+        zip_file: zipfile.ZipFile,
+        targets: list[tuple[zipfile.ZipInfo, str, SchemaInfo]],
+        dest_dir: Path,
+    ) -> dict[str, tuple[Path, Path]]:
+        """Stage schema entries one after the other, discarding all of them if any fails."""
+        staged: dict[str, tuple[Path, Path]] = {}
+        try:
+            for info, schema_name, schema_info in targets:
+                staged[schema_name] = self._stage_schema(
+                    zip_file, info, schema_name, schema_info, dest_dir
+                )
+        except BaseException:
+            _discard_staged(staged.values())
+            raise
+
+        return staged
+
+    def _stage_schemas_concurrently(
+        self,
+        zip_file: zipfile.ZipFile,
+        targets: list[tuple[zipfile.ZipInfo, str, SchemaInfo]],
+        dest_dir: Path,
+        workers: int,
+    ) -> dict[str, tuple[Path, Path]]:
+        """Stage schema entries on a thread pool, discarding all of them if any fails."""
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                schema_name: executor.submit(
+                    self._stage_schema, zip_file, info, schema_name, schema_info, dest_dir
+                )
+                for info, schema_name, schema_info in targets
+            }
+            try:
+                for future in as_completed(futures.values()):
+                    future.result()
+            except BaseException:
+                # Skip the schemas not started yet, then discard the ones that were staged
+                for future in futures.values():
+                    future.cancel()
+                wait(futures.values())
+                _discard_staged(
+                    future.result()
+                    for future in futures.values()
+                    if not future.cancelled() and future.exception() is None
+                )
+                raise
+
+        return {schema_name: future.result() for schema_name, future in futures.items()}
+
+    def verify_schemas(
+        self, bundle_path: str | Path, names: Iterable[str] | None = None
+    ) -> None:
+        """
+        Verify the checksums of several schema files without extracting them.
+
+        The bundle is opened and its manifest parsed once, and the schemas are
+        hashed in archive order, each in a single pass over its content.
+
+        Args:
+            bundle_path: Path to the .rbp bundle file.
+            names: Names of the schemas to verify (default: all schemas).
+
+        Raises:
+            PluginException: If a schema is not found or fails verification.
+        """
+        with self.open_bundle(bundle_path) as zip_file:
+            for info, schema_name, schema_info in self._schema_targets(zip_file, names):
+                with self._entry_view(zip_file, info) as (schema_data, digest):
+                    if digest is None:
+                        digest = hashlib.sha256(schema_data).digest()
+                if not self._digest_matches(digest, schema_info.checksum_bytes):
+                    raise PluginException(
+                        f"Checksum verification failed for schema {schema_name}"
+                    )
+
+    def _schema_targets(
+        self, zip_file: zipfile.ZipFile, names: Iterable[str] | None
+    ) -> list[tuple[zipfile.ZipInfo, str, SchemaInfo]]:
+        """Look up the named schemas (default: all), sorted by their position in the archive."""
+        manifest, _ = self._load_manifest(zip_file)
+        schemas = manifest.schemas
+
+        targets = []
+        for schema_name in schemas if names is None else dict.fromkeys(names):
+            schema_info = schemas.get(schema_name)
             if not schema_info:
                 raise PluginException(f"Schema not found in bundle: {schema_name}")
+            info = self._get_zip_info(zip_file, schema_info.path)
+            targets.append((info, schema_name, schema_info))
+        targets.sort(key=lambda target: target[0].header_offset)
+        return targets
 
-            # Read schema data
-            schema_data = self._read_zip_entry(zip_file, schema_info.path)
+    def _write_schema(
+        self,
+        zip_file: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        schema_name: str,
+        schema_info: SchemaInfo,
+        dest_dir: Path,
+    ) -> Path:
+        """Extract one schema entry to dest_dir, verifying its checksum first."""
+        staging_path, output_path = self._stage_schema(
+            zip_file, info, schema_name, schema_info, dest_dir
+        )
+        try:
+            os.replace(staging_path, output_path)
+        except BaseException:
+            staging_path.unlink(missing_ok=True)
+            raise
+        return output_path
+
+    def _stage_schema(
+        self,
+        zip_file: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        schema_name: str,
+        schema_info: SchemaInfo,
+        dest_dir: Path,
+    ) -> tuple[Path, Path]:
+        """
+        Stream one schema entry to a staging file next to its output path.
+
+        Returns the staging and output paths once the checksum has been verified;
+        the caller moves the staging file into place, so a schema that fails never
+        touches an existing file at the output path. A file being replaced keeps
+        its mode.
+        """
+        output_path = dest_dir / schema_name
+        staging_path = output_path.with_name(
+            f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            # Stream to the staging file, hashing as it is written
+            digest = self._stream_entry(zip_file, info, staging_path)
 
             # Verify checksum
-            if not self._verify_checksum(schema_data, schema_info.checksum):
+            if not self._digest_matches(digest, schema_info.checksum_bytes):
                 raise PluginException(
                     f"Checksum verification failed for schema {schema_name}"
                 )
 
-            # Write to output directory
-            output_path = dest_dir / schema_name
-            output_path.write_bytes(schema_data)
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(staging_path, os.stat(output_path).st_mode & 0o7777)
+        except BaseException:
+            staging_path.unlink(missing_ok=True)
+            raise
 
-            return output_path
+        return staging_path, output_path
 
     def read_schema(self, bundle_path: str | Path, schema_name: str) -> str:
         """
@@ -602,23 +1158,29 @@ class BundleLoader:
         Raises:
             PluginException: If reading fails or schema not found.
         """
-        with zipfile.ZipFile(bundle_path, "r") as zip_file:
-            manifest = self._load_manifest(zip_file)
+        with self.open_bundle(bundle_path) as zip_file:
+            return self._read_schema(zip_file, schema_name)
 
-            schema_info = manifest.schemas.get(schema_name)
-            if not schema_info:
-                raise PluginException(f"Schema not found in bundle: {schema_name}")
+    def _read_schema(self, zip_file: zipfile.ZipFile, schema_name: str) -> str:
+        """Read a schema file content from an opened bundle."""
+        manifest, _ = self._load_manifest(zip_file)
 
-            # Read schema data
-            schema_data = self._read_zip_entry(zip_file, schema_info.path)
+        schema_info = manifest.schemas.get(schema_name)
+        if not schema_info:
+            raise PluginException(f"Schema not found in bundle: {schema_name}")
 
+        # Read schema data (in place for stored entries, hashed while read otherwise)
+        info = self._get_zip_info(zip_file, schema_info.path)
+        with self._entry_view(zip_file, info) as (schema_data, digest):
             # Verify checksum
-            if not self._verify_checksum(schema_data, schema_info.checksum):
+            if digest is None:
+                digest = hashlib.sha256(schema_data).digest()
+            if not self._digest_matches(digest, schema_info.checksum_bytes):
                 raise PluginException(
                     f"Checksum verification failed for schema {schema_name}"
                 )
 
-            return schema_data.decode("utf-8")
+            return str(schema_data, "utf-8")
 
     @staticmethod
     def get_current_platform() -> str:
@@ -628,31 +1190,285 @@ class BundleLoader:
         Returns:
             Platform string like "linux-x86_64", "darwin-aarch64", etc.
         """
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        # platform caches uname() itself; the normalized string is memoized per result
+        return _platform_string(platform.system(), platform.machine())
+
+    @contextmanager
+    def open_bundle(self, bundle_path: str | Path) -> Iterator[zipfile.ZipFile]:
+        """
+        Open a bundle once for a series of operations on it.
 
-        os_map = {"linux": "linux", "darwin": "darwin", "windows": "windows"}
-        arch_map = {
-            "x86_64": "x86_64",
-            "amd64": "x86_64",
-            "aarch64": "aarch64",
-            "arm64": "aarch64",
-        }
+        While the block is active, the path-based methods of this loader called
+        from the same thread with the same bundle path reuse the open archive
+        instead of opening it and parsing its central directory again.
 
-        os_name = os_map.get(system, system)
-        arch_name = arch_map.get(machine, machine)
+        Args:
+            bundle_path: Path to the .rbp bundle file.
 
-        return f"{os_name}-{arch_name}"
+        Yields:
+            The opened bundle archive; only valid inside the with block.
 
-    def _load_manifest(self, zip_file: zipfile.ZipFile) -> BundleManifest:
-        """Load and parse the manifest from a zip file."""
+        Example:
+            with loader.open_bundle("my-plugin-1.0.0.rbp"):
+                if loader.has_jni_bridge("my-plugin-1.0.0.rbp"):
+                    loader.extract_jni_bridge("my-plugin-1.0.0.rbp", "lib")
+                header = loader.read_schema("my-plugin-1.0.0.rbp", "messages.h")
+        """
+        key = os.path.abspath(bundle_path)
+        open_bundles: dict[str, zipfile.ZipFile] | None = getattr(
+            self._open_bundles, "bundles", None
+        )
+        if open_bundles is None:
+            open_bundles = self._open_bundles.bundles = {}
+
+        zip_file = open_bundles.get(key)
+        if zip_file is not None:
+            yield zip_file
+            return
+
+        with self._open_zip(bundle_path) as zip_file:
+            open_bundles[key] = zip_file
+            try:
+                yield zip_file
+            finally:
+                del open_bundles[key]
+
+    @staticmethod
+    @contextmanager
+    def _open_zip(bundle_path: str | Path) -> Iterator[zipfile.ZipFile]:
+        """
+        Open a bundle as a zip archive backed by a read-only memory map.
+
+        Reading entries through the mapping is served from the page cache without
+        a read()/seek() syscall per access, and the archive is never copied into
+        a Python buffer as a whole.
+        """
+        with contextlib.ExitStack() as stack:
+            try:
+                file = stack.enter_context(open(bundle_path, "rb"))
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Bundle not found: {bundle_path}") from None
+
+            try:
+                mapped = stack.enter_context(
+                    _MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+            except ValueError:
+                # Empty files cannot be mapped; let zipfile report the bad archive
+                yield stack.enter_context(zipfile.ZipFile(file, "r"))
+                return
+
+            # Lets zipfile record the bundle path as the archive's filename
+            mapped.name = os.fspath(bundle_path)
+            yield stack.enter_context(zipfile.ZipFile(mapped, "r"))
+
+    def _extract_verified_entry(
+        self,
+        zip_file: zipfile.ZipFile,
+        manifest: BundleManifest,
+        entry: ExtractEntry,
+        output_path: Path,
+        *,
+        checksum_error: str,
+    ) -> None:
+        """
+        Extract a library entry to output_path, verifying checksum and signature.
+
+        The entry is written to disk first and verified there, so the bytes that
+        were checked are exactly the bytes that get loaded; a file that fails
+        verification is removed. Uncompressed entries are copied inside the
+        kernel and hashed through a memory map of the output. Compressed entries
+        are inflated in fixed-size chunks that are hashed as they are written, so
+        the library is never held in memory as a whole, and the signature prehash
+        is taken in the same pass.
+        """
+        info = self._get_zip_info(zip_file, entry.library)
+
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+                self._copy_stored_entry(zip_file, info, output_path)
+                digest = prehash = None
+            else:
+                # The signature prehash is taken in the same pass as the checksum
+                prehasher = hashlib.blake2b(digest_size=64) if self._verify_signatures else None
+                digest = self._stream_entry(
+                    zip_file, info, output_path, _LIBRARY_MODE, prehasher
+                )
+                prehash = prehasher.digest() if prehasher is not None else None
+
+            self._verify_extracted(
+                zip_file,
+                manifest,
+                entry,
+                output_path,
+                digest,
+                prehash,
+                checksum_error=checksum_error,
+            )
+        except BaseException:
+            output_path.unlink(missing_ok=True)
+            raise
+
+    def _verify_extracted(
+        self,
+        zip_file: zipfile.ZipFile,
+        manifest: BundleManifest,
+        entry: ExtractEntry,
+        path: Path,
+        digest: bytes | None,
+        prehash: bytes | None = None,
+        *,
+        checksum_error: str,
+    ) -> None:
+        """
+        Verify an extracted library file.
+
+        digest is its SHA256 and prehash its BLAKE2b-512 (the minisign prehash) when
+        they were taken while writing it; without a digest the file is mapped and
+        hashed here.
+        """
+        # The checksum is checked even when the library signature is: the library's
+        # .minisig only proves the key holder signed these bytes at some point, while
+        # the checksum in the signed manifest pins them to this bundle, so a library
+        # signed with the same key (e.g. an older release) cannot be swapped in.
+        if digest is not None:
+            if not self._digest_matches(digest, entry.checksum_bytes):
+                raise PluginException(checksum_error)
+            if self._verify_signatures:
+                self._verify_library_signature(zip_file, manifest, entry, path, prehash)
+            return
+
+        with _map_file(path) as data:
+            if not self._digest_matches(hashlib.sha256(data).digest(), entry.checksum_bytes):
+                raise PluginException(checksum_error)
+            if self._verify_signatures:
+                self._verify_library_signature(zip_file, manifest, entry, data)
+
+    @staticmethod
+    def _stream_entry(
+        zip_file: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        output_path: Path,
+        mode: int = 0o666,
+        prehasher: hashlib._Hash | None = None,
+    ) -> bytes:
+        """
+        Decompress an entry to output_path in chunks, returning its SHA256 digest.
+
+        If prehasher is given, it is updated with every chunk as well.
+        """
+        hasher = hashlib.sha256()
+        with zip_file.open(info) as src, _create_output(output_path, mode) as dst:
+            while chunk := src.read(_INFLATE_CHUNK_SIZE):
+                hasher.update(chunk)
+                if prehasher is not None:
+                    prehasher.update(chunk)
+                dst.write(chunk)
+        return hasher.digest()
+
+    @staticmethod
+    def _copy_stored_entry(
+        zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, output_path: Path
+    ) -> None:
+        """Copy the raw bytes of an uncompressed entry from the bundle to output_path."""
+        with (
+            open(zip_file.filename, "rb") as src,
+            _create_output(output_path, _LIBRARY_MODE) as dst,
+        ):
+            src.seek(info.header_offset)
+            data_offset = _entry_data_offset(info, src.read(_LOCAL_HEADER.size))
+            _copy_file_range(src.fileno(), dst.fileno(), data_offset, info.file_size)
+
+    @staticmethod
+    @contextmanager
+    def _entry_view(
+        zip_file: zipfile.ZipFile, info: zipfile.ZipInfo
+    ) -> Iterator[tuple[bytearray | memoryview, bytes | None]]:
+        """
+        Provide the content of an entry and, when already known, its SHA256 digest.
+
+        For uncompressed entries of a memory-mapped bundle this yields a read-only
+        view into the mapping, so no copy of the entry is made; the view is only
+        valid inside the with block, and the digest is None. Other entries are
+        inflated in chunks into one buffer of the entry's size, hashing each chunk
+        as it arrives, so the content is copied once and never re-read to hash it.
+        """
+        mapped = zip_file.fp
+        if (
+            not isinstance(mapped, _MappedFile)
+            or info.compress_type != zipfile.ZIP_STORED
+            or info.flag_bits & 0x1
+        ):
+            yield BundleLoader._read_entry_hashed(zip_file, info)
+            return
+
+        header_end = info.header_offset + _LOCAL_HEADER.size
+        data_offset = _entry_data_offset(info, mapped[info.header_offset : header_end])
+        if data_offset + info.file_size > len(mapped):
+            raise PluginException(f"Truncated entry in bundle: {info.filename}")
+
+        # The mapping is read-only, so views of it are too
+        with memoryview(mapped) as whole, whole[data_offset : data_offset + info.file_size] as view:
+            yield view, None
+
+    @staticmethod
+    def _read_entry_hashed(
+        zip_file: zipfile.ZipFile, info: zipfile.ZipInfo
+    ) -> tuple[bytearray, bytes]:
+        """Inflate an entry into a buffer of its size, returning it with its SHA256 digest."""
+        hasher = hashlib.sha256()
+        size = info.file_size
+        data = bytearray(min(size, _INFLATE_PREALLOCATE_LIMIT))
+        with zip_file.open(info) as src:
+            filled = 0
+            while filled < size:
+                if filled == len(data):
+                    # Past the preallocation: double the buffer, up to the declared size
+                    data.extend(bytes(min(len(data), size - filled)))
+                # A view per chunk, as a bytearray cannot be resized while one exists
+                with memoryview(data)[filled : filled + _INFLATE_CHUNK_SIZE] as chunk:
+                    read = src.readinto(chunk)
+                    if not read:
+                        raise PluginException(f"Truncated entry in bundle: {info.filename}")
+                    hasher.update(chunk[:read])
+                filled += read
+        return data, hasher.digest()
+
+    def _load_manifest(self, zip_file: zipfile.ZipFile) -> tuple[BundleManifest, bytes]:
+        """
+        Load and parse the manifest from a zip file, returning it with its raw bytes.
+
+        The object returned is always the parse of the bytes returned with it.
+        """
         manifest_data = self._read_zip_entry(zip_file, "manifest.json")
-        return BundleManifest.from_json(manifest_data.decode("utf-8"))
+        return self._parse_manifest(manifest_data), manifest_data
+
+    def _parse_manifest(self, manifest_data: bytes) -> BundleManifest:
+        """
+        Parse manifest bytes, memoized by their exact bytes.
+
+        Repeated operations on one bundle then only read the (small) manifest
+        entry. The memoized objects are only used inside the loader (extraction,
+        verification and the introspection helpers that return plain values), so
+        no caller can modify what a later extraction verifies against.
+        """
+        manifest = self._parsed_manifests.get(manifest_data)
+        if manifest is None:
+            manifest = BundleManifest.from_bytes(manifest_data)
+            with self._manifest_cache_lock:
+                if len(self._parsed_manifests) >= _MANIFEST_CACHE_SIZE:
+                    del self._parsed_manifests[next(iter(self._parsed_manifests))]
+                self._parsed_manifests[manifest_data] = manifest
+
+        return manifest
 
     def _verify_manifest_signature(
-        self, zip_file: zipfile.ZipFile, manifest: BundleManifest
+        self, zip_file: zipfile.ZipFile, manifest: BundleManifest, manifest_data: bytes
     ) -> None:
-        """Verify the manifest signature."""
+        """Verify the manifest signature over the manifest bytes it was parsed from."""
         public_key = self._public_key_override or manifest.public_key
 
         if not public_key:
@@ -661,9 +1477,6 @@ class BundleLoader:
                 "Bundle must include public_key in manifest, or provide via public_key_override."
             )
 
-        # Read manifest data
-        manifest_data = self._read_zip_entry(zip_file, "manifest.json")
-
         # Read signature
         try:
             sig_data = self._read_zip_entry(zip_file, "manifest.json.minisig")
@@ -675,7 +1488,7 @@ class BundleLoader:
         signature = sig_data.decode("utf-8")
 
         # Verify
-        verifier = MinisignVerifier(public_key)
+        verifier = _get_verifier(public_key)
         if not verifier.verify(manifest_data, signature):
             raise PluginException("Manifest signature verification failed")
 
@@ -683,17 +1496,24 @@ class BundleLoader:
         self,
         zip_file: zipfile.ZipFile,
         manifest: BundleManifest,
-        library_path: str,
-        library_data: bytes,
+        entry: ExtractEntry,
+        library: Path | bytes | mmap.mmap,
+        prehash: bytes | None = None,
     ) -> None:
-        """Verify the library signature."""
+        """
+        Verify the library signature.
+
+        library is the library content, or the path of the extracted file. With the
+        BLAKE2b-512 prehash at hand, a prehashed signature is checked without
+        touching the content; only a legacy signature needs the file read again.
+        """
         public_key = self._public_key_override or manifest.public_key
 
         if not public_key:
             raise PluginException("No public key available for signature verification")
 
         # Read signature
-        sig_path = library_path + ".minisig"
+        sig_path = entry.signature_path
         try:
             sig_data = self._read_zip_entry(zip_file, sig_path)
         except PluginException:
@@ -704,12 +1524,27 @@ class BundleLoader:
         signature = sig_data.decode("utf-8")
 
         # Verify
-        verifier = MinisignVerifier(public_key)
-        if not verifier.verify(library_data, signature):
+        verifier = _get_verifier(public_key)
+        if prehash is not None and verifier.is_prehashed(signature):
+            valid = verifier.verify_prehashed(prehash, signature)
+        elif isinstance(library, Path):
+            with _map_file(library) as data:
+                valid = verifier.verify(data, signature)
+        else:
+            valid = verifier.verify(library, signature)
+        if not valid:
             raise PluginException(
-                f"Library signature verification failed: {library_path}"
+                f"Library signature verification failed: {entry.library}"
             )
 
+    @staticmethod
+    def _get_zip_info(zip_file: zipfile.ZipFile, path: str) -> zipfile.ZipInfo:
+        """Look up an entry in the zip archive."""
+        try:
+            return zip_file.getinfo(path)
+        except KeyError as e:
+            raise PluginException(f"File not found in bundle: {path}") from e
+
     @staticmethod
     def _read_zip_entry(zip_file: zipfile.ZipFile, path: str) -> bytes:
         """Read a file from the zip archive."""
@@ -719,13 +1554,6 @@ class BundleLoader:
             raise PluginException(f"File not found in bundle: {path}")
 
     @staticmethod
-    def _verify_checksum(data: bytes, expected_checksum: str) -> bool:
-        """Verify SHA256 checksum."""
-        actual_hash = hashlib.sha256(data).hexdigest()
-
-        # Handle both "sha256:xxx" and raw "xxx" formats
-        expected = expected_checksum
-        if expected.lower().startswith("sha256:"):
-            expected = expected[7:]
-
-        return actual_hash.lower() == expected.lower()
+    def _digest_matches(actual_digest: bytes, expected_digest: bytes | None) -> bool:
+        """Compare a raw SHA256 digest against a decoded checksum (None never matches)."""
+        return expected_digest is not None and hmac.compare_digest(actual_digest, expected_digest)
@@ -2,14 +2,60 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass, field
 from typing import Any
 
+from rustbridge.core._json import loads as _json_loads
 from rustbridge.core.plugin_exception import PluginException
 
 
-@dataclass
+def parse_checksum(checksum: str) -> bytes | None:
+    """
+    Decode a manifest checksum ("sha256:<hex>" or bare hex, either case) to raw bytes.
+
+    Returns:
+        The raw SHA256 digest, or None if the checksum is not valid hex.
+    """
+    prefix = checksum[:7]
+    if prefix == "sha256:" or prefix.lower() == "sha256:":
+        checksum = checksum[7:]
+    try:
+        return bytes.fromhex(checksum)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class ExtractEntry:
+    """A library entry resolved for one platform and variant, ready for extraction."""
+
+    library: str
+    """Path to the library file within the bundle."""
+
+    checksum: str
+    """SHA256 checksum of the library, as written in the manifest."""
+
+    checksum_bytes: bytes | None
+    """Raw SHA256 digest decoded from checksum, or None if it is not valid hex."""
+
+    signature_path: str
+    """Path to the library's minisign signature within the bundle."""
+
+    @classmethod
+    def for_library(cls, library: str, checksum: str) -> ExtractEntry:
+        """Create an entry, decoding the checksum and deriving the signature path."""
+        return cls(library, checksum, parse_checksum(checksum), library + ".minisig")
+
+
+# Entries are immutable and keyed by the values they are built from, so resolving
+# the same library again reuses one (and its decoded checksum) without going stale
+# when a manifest's fields are changed afterwards.
+_entry_for_library = functools.lru_cache(maxsize=256)(ExtractEntry.for_library)
+
+
+@dataclass(slots=True)
 class VariantInfo:
     """Variant-specific library information."""
 
@@ -23,7 +69,7 @@ class VariantInfo:
     """Optional build metadata (profile, opt_level, features, etc.)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformInfo:
     """Platform-specific library information with variant support."""
 
@@ -39,17 +85,33 @@ class PlatformInfo:
     variants: dict[str, VariantInfo] = field(default_factory=dict)
     """Map of variant name to VariantInfo (v2.0+)."""
 
+    def resolve(self, variant: str | None = None) -> ExtractEntry:
+        """
+        Resolve the library entry for a variant.
+
+        Args:
+            variant: Variant name; None selects the default variant.
+
+        Returns:
+            The variant's entry, or the platform's own library and checksum if the
+            variant is not listed.
+        """
+        if variant is None:
+            variant = self.get_default_variant()
+        info = self.variants.get(variant)
+        if info is None:
+            return _entry_for_library(self.library, self.checksum)
+        return _entry_for_library(info.library, info.checksum)
+
     def get_library(self, variant: str) -> str:
         """Get the effective library path for a variant."""
-        if self.variants and variant in self.variants:
-            return self.variants[variant].library
-        return self.library
+        info = self.variants.get(variant)
+        return info.library if info is not None else self.library
 
     def get_checksum(self, variant: str) -> str:
         """Get the effective checksum for a variant."""
-        if self.variants and variant in self.variants:
-            return self.variants[variant].checksum
-        return self.checksum
+        info = self.variants.get(variant)
+        return info.checksum if info is not None else self.checksum
 
     def get_default_variant(self) -> str:
         """Get the default variant name."""
@@ -62,7 +124,7 @@ class PlatformInfo:
         return list(self.variants.keys())
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """Plugin metadata information."""
 
@@ -74,7 +136,7 @@ class PluginInfo:
     repository: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaInfo:
     """Schema file information."""
 
@@ -90,8 +152,26 @@ class SchemaInfo:
     description: str | None = None
     """Schema description."""
 
+    _decoded_from: str | None = field(default=None, init=False, repr=False, compare=False)
+    _checksum_bytes: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Decode once at parse time rather than on every verification
+        self._checksum_bytes = parse_checksum(self.checksum)
+        self._decoded_from = self.checksum
+
+    @property
+    def checksum_bytes(self) -> bytes | None:
+        """Raw SHA256 digest decoded from checksum, or None if it is not valid hex."""
+        checksum = self.checksum
+        if checksum is not self._decoded_from:
+            # checksum was reassigned since it was decoded
+            self._checksum_bytes = parse_checksum(checksum)
+            self._decoded_from = checksum
+        return self._checksum_bytes
 
-@dataclass
+
+@dataclass(slots=True)
 class GitInfo:
     """Git repository information."""
 
@@ -108,7 +188,7 @@ class GitInfo:
     """Whether working directory had uncommitted changes."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildInfo:
     """Build metadata information."""
 
@@ -131,7 +211,7 @@ class BuildInfo:
     """Git repository info."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Sbom:
     """Software Bill of Materials (SBOM) paths."""
 
@@ -142,7 +222,7 @@ class Sbom:
     """Path to SPDX SBOM file (e.g., "sbom/sbom.spdx.json")."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeInfo:
     """Bridge libraries bundled with the plugin.
 
@@ -154,7 +234,32 @@ class BridgeInfo:
     """JNI bridge libraries by platform."""
 
 
-@dataclass
+def _parse_platform(platform_value: dict[str, Any]) -> PlatformInfo:
+    """Parse one platform entry (with its variants) into PlatformInfo."""
+    # Bound lookups and positional fields, in declaration order: this runs for
+    # every platform and variant of every manifest parsed
+    get = platform_value.get
+    variants = {}
+    # Variants are present from bundle format v2.0
+    for variant_name, variant_value in get("variants", {}).items():
+        variant_get = variant_value.get
+        variants[variant_name] = VariantInfo(
+            variant_get("library", ""), variant_get("checksum", ""), variant_get("build")
+        )
+    return PlatformInfo(
+        get("library", ""), get("checksum", ""), get("default_variant"), variants
+    )
+
+
+def _parse_platforms(platforms_data: dict[str, Any]) -> dict[str, PlatformInfo]:
+    """Parse a platform table (the bundle's libraries or a bridge's) into PlatformInfo."""
+    return {
+        platform_key: _parse_platform(platform_value)
+        for platform_key, platform_value in platforms_data.items()
+    }
+
+
+@dataclass(slots=True)
 class BundleManifest:
     """
     Bundle manifest structure.
@@ -199,12 +304,12 @@ class BundleManifest:
     """Bridge libraries bundled with the plugin (e.g., JNI bridge)."""
 
     @classmethod
-    def from_json(cls, json_str: str) -> BundleManifest:
+    def from_json(cls, json_str: str | bytes) -> BundleManifest:
         """
         Parse a BundleManifest from JSON string.
 
         Args:
-            json_str: The JSON string.
+            json_str: The JSON string (or UTF-8 encoded bytes).
 
         Returns:
             The parsed BundleManifest.
@@ -213,12 +318,30 @@ class BundleManifest:
             PluginException: If parsing fails.
         """
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            data = _json_loads(json_str)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise PluginException(f"Failed to parse manifest JSON: {e}") from e
 
         return cls.from_dict(data)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BundleManifest:
+        """
+        Parse a BundleManifest from the raw manifest.json bytes of a bundle.
+
+        The bytes are handed to the JSON parser as-is, without decoding them first.
+
+        Args:
+            data: The UTF-8 encoded JSON bytes.
+
+        Returns:
+            The parsed BundleManifest.
+
+        Raises:
+            PluginException: If parsing fails.
+        """
+        return cls.from_json(data)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> BundleManifest:
         """
@@ -234,38 +357,20 @@ class BundleManifest:
             PluginException: If required fields are missing.
         """
         bundle_version = data.get("bundle_version")
-        if not bundle_version:
-            raise PluginException("Missing required field: bundle_version")
-
         plugin_data = data.get("plugin", {})
         plugin_name = plugin_data.get("name")
         plugin_version = plugin_data.get("version")
 
-        if not plugin_name:
-            raise PluginException("Missing required field: plugin.name")
-        if not plugin_version:
-            raise PluginException("Missing required field: plugin.version")
+        for field_name, value in (
+            ("bundle_version", bundle_version),
+            ("plugin.name", plugin_name),
+            ("plugin.version", plugin_version),
+        ):
+            if not value:
+                raise PluginException(f"Missing required field: {field_name}")
 
         # Parse platforms
-        platforms_data = data.get("platforms", {})
-        platforms: dict[str, PlatformInfo] = {}
-        for platform_key, platform_value in platforms_data.items():
-            # Parse variants if present (v2.0+)
-            variants: dict[str, VariantInfo] = {}
-            variants_data = platform_value.get("variants", {})
-            for variant_name, variant_value in variants_data.items():
-                variants[variant_name] = VariantInfo(
-                    library=variant_value.get("library", ""),
-                    checksum=variant_value.get("checksum", ""),
-                    build=variant_value.get("build"),
-                )
-
-            platforms[platform_key] = PlatformInfo(
-                library=platform_value.get("library", ""),
-                checksum=platform_value.get("checksum", ""),
-                default_variant=platform_value.get("default_variant"),
-                variants=variants,
-            )
+        platforms = _parse_platforms(data.get("platforms", {}))
 
         # Parse plugin info
         plugin_info = None
@@ -280,15 +385,16 @@ class BundleManifest:
             )
 
         # Parse schemas
-        schemas: dict[str, SchemaInfo] = {}
-        schemas_data = data.get("schemas", {})
-        for schema_name, schema_value in schemas_data.items():
-            schemas[schema_name] = SchemaInfo(
-                path=schema_value.get("path", ""),
-                checksum=schema_value.get("checksum", ""),
-                format=schema_value.get("format"),
-                description=schema_value.get("description"),
+        # Fields are passed positionally, in declaration order
+        schemas = {
+            schema_name: SchemaInfo(
+                schema_value.get("path", ""),
+                schema_value.get("checksum", ""),
+                schema_value.get("format"),
+                schema_value.get("description"),
             )
+            for schema_name, schema_value in data.get("schemas", {}).items()
+        }
 
         # Parse build info
         build_info: BuildInfo | None = None
@@ -325,26 +431,7 @@ class BundleManifest:
         bridges: BridgeInfo | None = None
         bridges_data = data.get("bridges")
         if bridges_data:
-            jni_platforms: dict[str, PlatformInfo] = {}
-            jni_data = bridges_data.get("jni", {})
-            for platform_key, platform_value in jni_data.items():
-                # Parse variants if present
-                variants: dict[str, VariantInfo] = {}
-                variants_data = platform_value.get("variants", {})
-                for variant_name, variant_value in variants_data.items():
-                    variants[variant_name] = VariantInfo(
-                        library=variant_value.get("library", ""),
-                        checksum=variant_value.get("checksum", ""),
-                        build=variant_value.get("build"),
-                    )
-
-                jni_platforms[platform_key] = PlatformInfo(
-                    library=platform_value.get("library", ""),
-                    checksum=platform_value.get("checksum", ""),
-                    default_variant=platform_value.get("default_variant"),
-                    variants=variants,
-                )
-            bridges = BridgeInfo(jni=jni_platforms)
+            bridges = BridgeInfo(jni=_parse_platforms(bridges_data.get("jni", {})))
 
         return cls(
             bundle_version=bundle_version,
@@ -361,6 +448,20 @@ class BundleManifest:
             bridges=bridges,
         )
 
+    def resolve(self, platform: str, variant: str | None = None) -> ExtractEntry | None:
+        """
+        Resolve the library entry for a platform and variant.
+
+        Args:
+            platform: Platform string (e.g., "linux-x86_64").
+            variant: Variant name; None selects the platform's default variant.
+
+        Returns:
+            ExtractEntry if the platform is supported, None otherwise.
+        """
+        platform_info = self.platforms.get(platform)
+        return platform_info.resolve(variant) if platform_info is not None else None
+
     def get_platform(self, platform: str) -> PlatformInfo | None:
         """
         Get platform info for a specific platform.
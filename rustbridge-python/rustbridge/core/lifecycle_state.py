@@ -37,14 +37,24 @@ class LifecycleState(IntEnum):
         Raises:
             ValueError: If code is not in range 0-5.
         """
-        if 0 <= code <= 5:
-            return cls(code)
-        raise ValueError(f"Invalid lifecycle state code: {code}")
+        try:
+            return _FROM_CODE[code]
+        except KeyError:
+            raise ValueError(f"Invalid lifecycle state code: {code}") from None
 
     def can_handle_requests(self) -> bool:
         """Check if this state can handle requests."""
-        return self == LifecycleState.ACTIVE
+        return self is _ACTIVE
 
     def is_terminal(self) -> bool:
         """Check if this is a terminal state (stopped or failed)."""
-        return self in (LifecycleState.STOPPED, LifecycleState.FAILED)
+        return self in _TERMINAL
+
+
+# Code -> member table; a dict hit avoids EnumMeta.__call__ on the FFI hot path
+_FROM_CODE: dict[int, LifecycleState] = {member.value: member for member in LifecycleState}
+
+# Members are singletons, so the state predicates are an identity test and a set
+# probe, with no class attribute lookup through EnumMeta per call
+_ACTIVE = LifecycleState.ACTIVE
+_TERMINAL = frozenset((LifecycleState.STOPPED, LifecycleState.FAILED))
@@ -37,9 +37,10 @@ class LogLevel(IntEnum):
         Raises:
             ValueError: If code is not in range 0-5.
         """
-        if 0 <= code <= 5:
-            return cls(code)
-        raise ValueError(f"Invalid log level code: {code}")
+        try:
+            return _FROM_CODE[code]
+        except KeyError:
+            raise ValueError(f"Invalid log level code: {code}") from None
 
     @classmethod
     def from_string(cls, level: str) -> "LogLevel":
@@ -55,13 +56,28 @@ class LogLevel(IntEnum):
         Raises:
             ValueError: If level string is not recognized.
         """
-        level_upper = level.upper()
+        member = _FROM_NAME.get(level)
+        if member is not None:
+            return member
         try:
-            return cls[level_upper]
+            return cls[level.upper()]
         except KeyError:
             valid = ", ".join(l.name.lower() for l in cls)
             raise ValueError(f"Invalid log level: {level}. Valid values: {valid}") from None
 
     def to_string(self) -> str:
         """Return the lowercase string representation."""
-        return self.name.lower()
+        return _LOWER_NAMES[self]
+
+
+# Code -> member table; a dict hit avoids EnumMeta.__call__ on the FFI hot path
+_FROM_CODE: dict[int, LogLevel] = {member.value: member for member in LogLevel}
+
+# Lowercase names indexed by code (the codes are 0-5), and the exact-case names
+# from_string sees most often; other spellings fall back to upper-casing
+_LOWER_NAMES: tuple[str, ...] = tuple(member.name.lower() for member in LogLevel)
+_FROM_NAME: dict[str, LogLevel] = {
+    name: member
+    for member in LogLevel
+    for name in (member.name, member.name.lower())
+}
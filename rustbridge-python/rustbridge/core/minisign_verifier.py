@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import base64
 import hashlib
+from collections.abc import Callable, Iterable
 
-from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+# Optional: the `cryptography` package verifies detached Ed25519 signatures through
+# OpenSSL without concatenating signature and message first, which avoids copying
+# the signed data for large non-prehashed payloads. PyNaCl remains the fallback.
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+except ImportError:
+    Ed25519PublicKey = None
 
 
 # Minisign format constants
@@ -22,6 +32,32 @@ _ED25519_PUBKEY_ALGORITHM_ID = bytes([0x45, 0x64])
 _ED25519_SIG_ALGORITHM_ID = bytes([0x45, 0x44])
 
 
+def _create_ed25519_verify(public_key: bytes) -> Callable[[bytes, bytes], bool]:
+    """Create a function verifying detached Ed25519 signatures for a public key."""
+    if Ed25519PublicKey is not None:
+        openssl_key = Ed25519PublicKey.from_public_bytes(public_key)
+
+        def verify_openssl(message: bytes, signature: bytes) -> bool:
+            try:
+                openssl_key.verify(signature, message)
+                return True
+            except InvalidSignature:
+                return False
+
+        return verify_openssl
+
+    nacl_key = VerifyKey(public_key)
+
+    def verify_nacl(message: bytes, signature: bytes) -> bool:
+        try:
+            nacl_key.verify(message, signature)
+            return True
+        except BadSignatureError:
+            return False
+
+    return verify_nacl
+
+
 class MinisignVerifier:
     """
     Minisign signature verification using Ed25519.
@@ -51,7 +87,7 @@ class MinisignVerifier:
         """
         public_key_bytes, key_id = self._parse_public_key(public_key_base64)
         self._key_id = key_id
-        self._verify_key = VerifyKey(public_key_bytes)
+        self._verify_signature = _create_ed25519_verify(public_key_bytes)
 
     @staticmethod
     def _parse_public_key(public_key_base64: str) -> tuple[bytes, bytes]:
@@ -176,8 +212,72 @@ class MinisignVerifier:
             data_to_verify = data
 
         # Verify the signature using Ed25519
-        try:
-            self._verify_key.verify(data_to_verify, signature)
-            return True
-        except BadSignatureError:
+        return self._verify_signature(data_to_verify, signature)
+
+    def verify_prehashed(self, digest: bytes, signature_string: str) -> bool:
+        """
+        Verify a prehashed minisign signature from the BLAKE2b-512 digest of the data.
+
+        Lets a caller that already reads the data once (e.g. to checksum it) feed
+        the same pass into hashlib.blake2b(digest_size=64) instead of hashing the
+        data again here. Legacy non-prehashed signatures sign the data itself and
+        never verify this way; check is_prehashed() first and use verify() for them.
+
+        Args:
+            digest: BLAKE2b-512 digest of the data that was signed.
+            signature_string: The minisign signature (multi-line format).
+
+        Returns:
+            True if the signature is valid, False otherwise.
+
+        Raises:
+            ValueError: If signature parsing fails.
+        """
+        sig_key_id, signature, is_prehashed = self._parse_signature(signature_string)
+
+        if not is_prehashed or sig_key_id != self._key_id:
+            return False
+
+        return self._verify_signature(digest, signature)
+
+    def verify_many(self, pairs: Iterable[tuple[bytes, str]]) -> bool:
+        """
+        Verify several minisign signatures, e.g. for each signed artifact of a bundle.
+
+        Every signature is parsed before any is checked, so a malformed one raises
+        without spending Ed25519 work on the others. Stops at the first failure.
+
+        Args:
+            pairs: (data, signature_string) pairs.
+
+        Returns:
+            True if every signature is valid, False otherwise.
+
+        Raises:
+            ValueError: If parsing any signature fails.
+        """
+        parse_signature = self._parse_signature
+        parsed = [(data, *parse_signature(signature)) for data, signature in pairs]
+
+        key_id = self._key_id
+        if any(sig_key_id != key_id for _, sig_key_id, _, _ in parsed):
             return False
+
+        verify_signature = self._verify_signature
+        blake2b = hashlib.blake2b
+        for data, _, signature, is_prehashed in parsed:
+            message = blake2b(data, digest_size=64).digest() if is_prehashed else data
+            if not verify_signature(message, signature):
+                return False
+
+        return True
+
+    @classmethod
+    def is_prehashed(cls, signature_string: str) -> bool:
+        """
+        Check whether a minisign signature is prehashed ("ED") rather than legacy ("Ed").
+
+        Raises:
+            ValueError: If signature parsing fails.
+        """
+        return cls._parse_signature(signature_string)[2]
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from rustbridge.core._json import dumps as _json_dumps
 from rustbridge.core.log_level import LogLevel
 
 
@@ -21,6 +21,15 @@ class PluginConfig:
             .set("my_key", "my_value"))
     """
 
+    __slots__ = (
+        "_data",
+        "_init_params",
+        "_worker_threads",
+        "_log_level",
+        "_max_concurrent_ops",
+        "_shutdown_timeout_ms",
+    )
+
     def __init__(self) -> None:
         """Create a new empty configuration."""
         self._data: dict[str, Any] = {}
@@ -143,22 +152,12 @@ class PluginConfig:
         Serialize the configuration to JSON bytes.
 
         Returns:
-            The JSON bytes.
-        """
-        config: dict[str, Any] = {
-            "data": self._data,
-            "log_level": self._log_level,
-            "max_concurrent_ops": self._max_concurrent_ops,
-            "shutdown_timeout_ms": self._shutdown_timeout_ms,
-        }
+            The JSON bytes (compact UTF-8).
 
-        if self._init_params:
-            config["init_params"] = self._init_params
-
-        if self._worker_threads is not None:
-            config["worker_threads"] = self._worker_threads
-
-        return json.dumps(config).encode("utf-8")
+        Raises:
+            ValueError: If a value is a NaN or infinite float.
+        """
+        return _json_dumps(self.to_dict())
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -6,10 +6,20 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
+from rustbridge.core._json import dumps as _json_dumps
+from rustbridge.core._json import loads as _json_loads
 from rustbridge.core.plugin_exception import PluginException
 
 
-@dataclass
+def _parse_json(json_str: str | bytes | memoryview) -> Any:
+    """Parse response JSON, reporting malformed input as a PluginException."""
+    try:
+        return _json_loads(json_str)
+    except json.JSONDecodeError as e:
+        raise PluginException(f"Failed to parse response JSON: {e}") from e
+
+
+@dataclass(slots=True)
 class ResponseEnvelope:
     """
     Response envelope wrapping a response from FFI transport.
@@ -34,12 +44,12 @@ class ResponseEnvelope:
         return self.status == "success"
 
     @classmethod
-    def from_json(cls, json_str: str) -> ResponseEnvelope:
+    def from_json(cls, json_str: str | bytes) -> ResponseEnvelope:
         """
         Parse a ResponseEnvelope from JSON string.
 
         Args:
-            json_str: The JSON string.
+            json_str: The JSON string (or UTF-8 encoded bytes).
 
         Returns:
             The parsed ResponseEnvelope.
@@ -47,17 +57,43 @@ class ResponseEnvelope:
         Raises:
             PluginException: If parsing fails.
         """
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise PluginException(f"Failed to parse response JSON: {e}") from e
+        return cls._from_data(_parse_json(json_str))
+
+    @classmethod
+    def parse_payload(cls, json_str: str | bytes | memoryview) -> Any:
+        """
+        Parse a response and return its payload, raising for error responses.
+
+        Equivalent to from_json(json_str).unwrap(), but a success response is
+        read straight from the parsed JSON; an envelope is only built for errors.
+
+        Args:
+            json_str: The JSON string (or UTF-8 encoded bytes, or a memoryview of
+                them, e.g. straight over a native buffer).
+
+        Returns:
+            The payload value (None if the response has none).
+
+        Raises:
+            PluginException: If parsing fails or this is an error response.
+        """
+        data = _parse_json(json_str)
+        if data.get("status") == "success":
+            return data.get("payload")
+        raise cls._from_data(data).to_exception()
 
+    @classmethod
+    def _from_data(cls, data: dict[str, Any]) -> ResponseEnvelope:
+        """Build an envelope from a parsed response object."""
+        # Bind the lookup and pass fields positionally, in declaration order, to
+        # keep construction cheap.
+        get = data.get
         return cls(
-            status=data.get("status", "error"),
-            payload=data.get("payload"),
-            error_code=data.get("error_code"),
-            error_message=data.get("error_message"),
-            request_id=data.get("request_id"),
+            get("status", "error"),
+            get("payload"),
+            get("error_code"),
+            get("error_message"),
+            get("request_id"),
         )
 
     @classmethod
@@ -71,18 +107,35 @@ class ResponseEnvelope:
         Returns:
             The parsed ResponseEnvelope.
         """
-        return cls.from_json(data.decode("utf-8"))
+        return cls.from_json(data)
 
     def get_payload_json(self) -> str:
         """
         Get the payload as a JSON string.
 
         Returns:
-            The payload serialized as JSON, or "null" if no payload.
+            The payload serialized as compact JSON, or "null" if no payload.
+
+        Raises:
+            ValueError: If the payload holds a NaN or infinite float.
         """
         if self.payload is None:
             return "null"
-        return json.dumps(self.payload)
+        return _json_dumps(self.payload).decode("utf-8")
+
+    def get_payload_bytes(self) -> bytes:
+        """
+        Get the payload as UTF-8 encoded JSON bytes.
+
+        Returns:
+            The payload serialized as compact JSON, or b"null" if no payload.
+
+        Raises:
+            ValueError: If the payload holds a NaN or infinite float.
+        """
+        if self.payload is None:
+            return b"null"
+        return _json_dumps(self.payload)
 
     def to_exception(self) -> PluginException:
         """
@@ -1,13 +1,42 @@
 """Native bindings for rustbridge using ctypes."""
 
-from rustbridge.native.structures import FfiBuffer
-from rustbridge.native.library import NativeLibrary
-from rustbridge.native.native_plugin import NativePlugin
-from rustbridge.native.plugin_loader import NativePluginLoader
+from __future__ import annotations
 
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rustbridge.native.library import NativeLibrary, clear_library_cache
+    from rustbridge.native.native_plugin import NativePlugin
+    from rustbridge.native.plugin_loader import NativePluginLoader
+    from rustbridge.native.structures import FfiBuffer
+
+__all__ = (
     "FfiBuffer",
     "NativeLibrary",
     "NativePlugin",
     "NativePluginLoader",
-]
+    "clear_library_cache",
+)
+
+# Imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "FfiBuffer": "rustbridge.native.structures",
+    "NativeLibrary": "rustbridge.native.library",
+    "NativePlugin": "rustbridge.native.native_plugin",
+    "NativePluginLoader": "rustbridge.native.plugin_loader",
+    "clear_library_cache": "rustbridge.native.library",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,173 @@
 
 from __future__ import annotations
 
+import contextlib
 import ctypes
-from ctypes import c_bool, c_char_p, c_size_t, c_uint8, c_uint32, c_uint64, c_void_p, POINTER
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from ctypes import (
+    CFUNCTYPE,
+    POINTER,
+    c_bool,
+    c_char_p,
+    c_size_t,
+    c_uint8,
+    c_uint32,
+    c_uint64,
+    c_void_p,
+)
 from pathlib import Path
 
 from rustbridge.core.plugin_exception import PluginException
-from rustbridge.native.structures import FfiBuffer, RbResponse, LogCallbackFnType
+from rustbridge.native.structures import FfiBuffer, LogCallbackFnType, RbResponse
+
+# Prototypes for the C ABI exported by rustbridge plugins. Binding each symbol to a
+# prebuilt prototype fixes its argument conversion once at class creation, instead
+# of assigning argtypes/restype on every loaded library.
+#
+# CFUNCTYPE prototypes release the GIL while the native function runs, which lets
+# concurrent calls from Python threads execute in parallel. Do not switch these to
+# PYFUNCTYPE, which holds the GIL, and leave errno capture off as nothing reads it.
+
+# plugin_create() -> *mut c_void
+_PLUGIN_CREATE = CFUNCTYPE(c_void_p)
+
+# plugin_init(plugin_ptr, config_json, config_len, log_callback) -> handle
+# The config is declared as c_char_p, like plugin_call's request, so the bytes are
+# passed by pointer instead of being copied into a ctypes array first.
+_PLUGIN_INIT = CFUNCTYPE(
+    c_void_p,
+    c_void_p,  # plugin_ptr
+    c_char_p,  # config_json
+    c_size_t,  # config_len
+    LogCallbackFnType,  # log_callback (can be None/null)
+)
+
+# plugin_call(handle, type_tag, request, request_len) -> FfiBuffer
+# The request is declared as c_char_p so a bytes object is passed by pointer
+# without copying; its length is passed explicitly, so embedded NULs are fine.
+_PLUGIN_CALL = CFUNCTYPE(
+    FfiBuffer,
+    c_void_p,  # handle
+    c_char_p,  # type_tag (null-terminated)
+    c_char_p,  # request
+    c_size_t,  # request_len
+)
+
+# plugin_free_buffer(buffer*)
+_PLUGIN_FREE_BUFFER = CFUNCTYPE(None, POINTER(FfiBuffer))
+
+# plugin_shutdown(handle) -> bool
+_PLUGIN_SHUTDOWN = CFUNCTYPE(c_bool, c_void_p)
+
+# plugin_set_log_level(handle, level)
+_PLUGIN_SET_LOG_LEVEL = CFUNCTYPE(None, c_void_p, c_uint8)
+
+# plugin_get_state(handle) -> u8
+_PLUGIN_GET_STATE = CFUNCTYPE(c_uint8, c_void_p)
+
+# plugin_get_rejected_count(handle) -> u64
+_PLUGIN_GET_REJECTED_COUNT = CFUNCTYPE(c_uint64, c_void_p)
+
+# plugin_call_raw(handle, message_id, request, request_size) -> RbResponse
+_PLUGIN_CALL_RAW = CFUNCTYPE(
+    RbResponse,
+    c_void_p,  # handle
+    c_uint32,  # message_id
+    c_void_p,  # request
+    c_size_t,  # request_size
+)
+
+# rb_response_free(response*)
+_RB_RESPONSE_FREE = CFUNCTYPE(None, POINTER(RbResponse))
+
+_REQUIRED_FUNCTIONS = {
+    "plugin_create": _PLUGIN_CREATE,
+    "plugin_init": _PLUGIN_INIT,
+    "plugin_call": _PLUGIN_CALL,
+    "plugin_free_buffer": _PLUGIN_FREE_BUFFER,
+    "plugin_shutdown": _PLUGIN_SHUTDOWN,
+    "plugin_set_log_level": _PLUGIN_SET_LOG_LEVEL,
+    "plugin_get_state": _PLUGIN_GET_STATE,
+    "plugin_get_rejected_count": _PLUGIN_GET_REJECTED_COUNT,
+}
+
+# Binary transport functions are optional; see NativeLibrary.has_binary_transport
+_OPTIONAL_FUNCTIONS = {
+    "plugin_call_raw": _PLUGIN_CALL_RAW,
+    "rb_response_free": _RB_RESPONSE_FREE,
+}
+
+
+def _setup_functions(lib: ctypes.CDLL) -> None:
+    """Bind exported functions to their prototypes, replacing the untyped lookups."""
+    for name, prototype in _REQUIRED_FUNCTIONS.items():
+        setattr(lib, name, prototype((name, lib)))
+
+    for name, prototype in _OPTIONAL_FUNCTIONS.items():
+        with contextlib.suppress(AttributeError):
+            setattr(lib, name, prototype((name, lib)))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cdll(path: str) -> ctypes.CDLL:
+    """
+    Load a shared library and configure its function prototypes.
+
+    Results are cached per path, so loading the same library again skips symbol
+    resolution and argtypes/restype assignment.
+    """
+    lib = ctypes.CDLL(path)
+    _setup_functions(lib)
+    return lib
+
+
+_prefetch_lock = threading.Lock()
+_prefetch_executor: ThreadPoolExecutor | None = None
+_pending_loads: dict[str, Future[ctypes.CDLL]] = {}
+
+
+def prefetch_library(library_path: str | Path) -> None:
+    """
+    Start loading a shared library on a background thread.
+
+    The next NativeLibrary for the same path waits for this load instead of
+    calling dlopen itself, so relocation cost overlaps with other startup work.
+    Load errors are reported when the library is actually opened.
+    """
+    global _prefetch_executor
+
+    path = str(library_path)
+    with _prefetch_lock:
+        if path in _pending_loads:
+            return
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="rustbridge-prefetch"
+            )
+        _pending_loads[path] = _prefetch_executor.submit(_load_cdll, path)
+
+
+def _get_cdll(path: str) -> ctypes.CDLL:
+    """Return the configured library, waiting for a pending prefetch if there is one."""
+    with _prefetch_lock:
+        future = _pending_loads.pop(path, None)
+    if future is not None:
+        return future.result()
+    return _load_cdll(path)
+
+
+def clear_library_cache() -> None:
+    """
+    Clear the cache of loaded native libraries.
+
+    Subsequent loads re-resolve symbols. This does not unload libraries that are
+    still referenced by live plugins.
+    """
+    with _prefetch_lock:
+        _pending_loads.clear()
+    _load_cdll.cache_clear()
 
 
 class NativeLibrary:
@@ -29,73 +190,22 @@ class NativeLibrary:
         """
         self._path = str(library_path)
         try:
-            self._lib = ctypes.CDLL(self._path)
+            self._lib = _get_cdll(self._path)
         except OSError as e:
             raise PluginException(f"Failed to load library {library_path}: {e}") from e
 
-        self._setup_functions()
-
-    def _setup_functions(self) -> None:
-        """Set up function signatures for type safety."""
-        # plugin_create() -> *mut c_void
-        self._lib.plugin_create.argtypes = []
-        self._lib.plugin_create.restype = c_void_p
-
-        # plugin_init(plugin_ptr, config_json, config_len, log_callback) -> handle
-        self._lib.plugin_init.argtypes = [
-            c_void_p,  # plugin_ptr
-            POINTER(c_uint8),  # config_json
-            c_size_t,  # config_len
-            LogCallbackFnType,  # log_callback (can be None/null)
-        ]
-        self._lib.plugin_init.restype = c_void_p
-
-        # plugin_call(handle, type_tag, request, request_len) -> FfiBuffer
-        self._lib.plugin_call.argtypes = [
-            c_void_p,  # handle
-            c_char_p,  # type_tag (null-terminated)
-            POINTER(c_uint8),  # request
-            c_size_t,  # request_len
-        ]
-        self._lib.plugin_call.restype = FfiBuffer
-
-        # plugin_free_buffer(buffer*)
-        self._lib.plugin_free_buffer.argtypes = [POINTER(FfiBuffer)]
-        self._lib.plugin_free_buffer.restype = None
-
-        # plugin_shutdown(handle) -> bool
-        self._lib.plugin_shutdown.argtypes = [c_void_p]
-        self._lib.plugin_shutdown.restype = c_bool
-
-        # plugin_set_log_level(handle, level)
-        self._lib.plugin_set_log_level.argtypes = [c_void_p, c_uint8]
-        self._lib.plugin_set_log_level.restype = None
-
-        # plugin_get_state(handle) -> u8
-        self._lib.plugin_get_state.argtypes = [c_void_p]
-        self._lib.plugin_get_state.restype = c_uint8
-
-        # plugin_get_rejected_count(handle) -> u64
-        self._lib.plugin_get_rejected_count.argtypes = [c_void_p]
-        self._lib.plugin_get_rejected_count.restype = c_uint64
-
-        # Optional: binary transport functions
-        try:
-            # plugin_call_raw(handle, message_id, request, request_size) -> RbResponse
-            self._lib.plugin_call_raw.argtypes = [
-                c_void_p,  # handle
-                c_uint32,  # message_id
-                c_void_p,  # request
-                c_size_t,  # request_size
-            ]
-            self._lib.plugin_call_raw.restype = RbResponse
-
-            # rb_response_free(response*)
-            self._lib.rb_response_free.argtypes = [POINTER(RbResponse)]
-            self._lib.rb_response_free.restype = None
-            self._has_binary_transport = True
-        except AttributeError:
-            self._has_binary_transport = False
+        self._has_binary_transport = hasattr(self._lib, "plugin_call_raw") and hasattr(
+            self._lib, "rb_response_free"
+        )
+
+        # Bind the functions used on every call, saving the CDLL attribute lookup
+        # per invocation
+        self._plugin_call = self._lib.plugin_call
+        self._plugin_free_buffer = self._lib.plugin_free_buffer
+        self._plugin_get_state = self._lib.plugin_get_state
+        if self._has_binary_transport:
+            self._plugin_call_raw = self._lib.plugin_call_raw
+            self._rb_response_free = self._lib.rb_response_free
 
     @property
     def path(self) -> str:
@@ -107,6 +217,28 @@ class NativeLibrary:
         """Check if this library supports binary transport."""
         return self._has_binary_transport
 
+    def function_address(self, name: str) -> int:
+        """
+        Return the address of an exported FFI function.
+
+        Lets Cython, Numba or cffi code call the entry point directly, bypassing
+        the ctypes wrappers.
+
+        Args:
+            name: Exported symbol name (e.g., "plugin_call").
+
+        Returns:
+            The function address.
+
+        Raises:
+            PluginException: If the library does not export the symbol.
+        """
+        try:
+            function = getattr(self._lib, name)
+        except AttributeError:
+            raise PluginException(f"Library {self._path} does not export {name}") from None
+        return ctypes.cast(function, c_void_p).value or 0
+
     def plugin_create(self) -> c_void_p:
         """Create a new plugin instance."""
         return self._lib.plugin_create()
@@ -129,43 +261,40 @@ class NativeLibrary:
             Handle to the initialized plugin.
         """
         if config_bytes:
-            config_array = (c_uint8 * len(config_bytes))(*config_bytes)
-            config_ptr = ctypes.cast(config_array, POINTER(c_uint8))
             config_len = len(config_bytes)
         else:
-            config_ptr = None
+            config_bytes = None  # Null pointer: the plugin uses its defaults
             config_len = 0
 
         # Pass None if no callback, otherwise pass the callback
         callback = log_callback if log_callback else LogCallbackFnType(0)
 
-        return self._lib.plugin_init(plugin_ptr, config_ptr, config_len, callback)
+        return self._lib.plugin_init(plugin_ptr, config_bytes, config_len, callback)
 
     def plugin_call(
-        self, handle: c_void_p, type_tag: str, request: bytes
+        self, handle: c_void_p, type_tag: str | bytes, request: bytes | bytearray | memoryview
     ) -> FfiBuffer:
         """
         Make a call to the plugin.
 
         Args:
             handle: Plugin handle from plugin_init.
-            type_tag: Message type identifier.
-            request: Request payload bytes.
+            type_tag: Message type identifier (str, or already UTF-8 encoded bytes).
+            request: Request payload (bytes, bytearray or memoryview).
 
         Returns:
             FfiBuffer containing the response.
         """
-        type_tag_bytes = type_tag.encode("utf-8")
-        request_array = (c_uint8 * len(request))(*request)
-        request_ptr = ctypes.cast(request_array, POINTER(c_uint8))
-
-        return self._lib.plugin_call(
-            handle, type_tag_bytes, request_ptr, len(request)
-        )
+        if isinstance(type_tag, str):
+            type_tag = type_tag.encode("utf-8")
+        if type(request) is not bytes:
+            # c_char_p only takes bytes; copy other buffers (once) into one
+            request = bytes(request)
+        return self._plugin_call(handle, type_tag, request, len(request))
 
     def plugin_free_buffer(self, buffer: FfiBuffer) -> None:
         """Free a buffer returned by plugin_call."""
-        self._lib.plugin_free_buffer(ctypes.byref(buffer))
+        self._plugin_free_buffer(ctypes.byref(buffer))
 
     def plugin_shutdown(self, handle: c_void_p) -> bool:
         """Shutdown a plugin instance."""
@@ -177,7 +306,7 @@ class NativeLibrary:
 
     def plugin_get_state(self, handle: c_void_p) -> int:
         """Get the current state of a plugin."""
-        return self._lib.plugin_get_state(handle)
+        return self._plugin_get_state(handle)
 
     def plugin_get_rejected_count(self, handle: c_void_p) -> int:
         """Get the number of rejected requests."""
@@ -204,9 +333,9 @@ class NativeLibrary:
         if not self._has_binary_transport:
             raise PluginException("Binary transport not supported by this library")
 
-        return self._lib.plugin_call_raw(handle, message_id, request_ptr, request_size)
+        return self._plugin_call_raw(handle, message_id, request_ptr, request_size)
 
     def rb_response_free(self, response: RbResponse) -> None:
         """Free a binary response."""
         if self._has_binary_transport:
-            self._lib.rb_response_free(ctypes.byref(response))
+            self._rb_response_free(ctypes.byref(response))
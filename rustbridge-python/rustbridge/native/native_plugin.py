@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import ctypes
-import json
-from ctypes import Structure, addressof, c_void_p, memmove, sizeof
-from typing import Any, Callable, TypeVar
+from collections.abc import Callable, Iterable
+from ctypes import Structure, addressof, c_uint8, c_void_p, sizeof
+from typing import Any, TypeVar
 
+from rustbridge.core._json import dumps as _dumps_json
 from rustbridge.core.lifecycle_state import LifecycleState
 from rustbridge.core.log_level import LogLevel
 from rustbridge.core.plugin_exception import PluginException
@@ -22,6 +23,10 @@ TResponse = TypeVar("TResponse", bound=Structure)
 # Type alias for log callback
 LogCallbackFn = Callable[[LogLevel, str, str], None]
 
+# Upper bound on cached type tag encodings; tags are normally a small fixed set,
+# this only guards against callers that generate tags dynamically.
+_TYPE_TAG_CACHE_LIMIT = 256
+
 
 class NativePlugin:
     """
@@ -30,7 +35,9 @@ class NativePlugin:
     This implementation uses Python's ctypes to call native plugin functions directly.
 
     Thread Safety: This class delegates to the Rust plugin implementation which is
-    thread-safe (Send + Sync), allowing concurrent execution.
+    thread-safe (Send + Sync), allowing concurrent execution. The GIL is released
+    for the duration of each native call, so calls from several Python threads run
+    in parallel inside the plugin.
 
     Example:
         with NativePluginLoader.load("libmyplugin.so") as plugin:
@@ -61,6 +68,7 @@ class NativePlugin:
         self._log_callback = log_callback
         self._callback_ref = _callback_ref
         self._disposed = False
+        self._type_tag_cache: dict[str, bytes] = {}
 
     @property
     def state(self) -> LifecycleState:
@@ -92,6 +100,45 @@ class NativePlugin:
         self._throw_if_disposed()
         return self._library.plugin_get_rejected_count(self._handle)
 
+    @property
+    def native_handle(self) -> int:
+        """
+        Get the raw plugin handle for use with the native entry points.
+
+        Raises:
+            PluginException: If the plugin has been disposed.
+        """
+        self._throw_if_disposed()
+        return self._handle or 0
+
+    def native_entry_points(self) -> dict[str, int]:
+        """
+        Get the addresses of the native call entry points.
+
+        Together with `native_handle`, this lets compiled callers (Cython, Numba,
+        cffi) invoke the plugin without going through the Python call path. The
+        caller owns every returned buffer and must release it with the matching
+        free function, and must not use the handle after the plugin is closed.
+
+        The signatures are those of the C ABI:
+            FfiBuffer plugin_call(void *handle, const char *type_tag,
+                                  const uint8_t *request, size_t request_len)
+            void plugin_free_buffer(FfiBuffer *buffer)
+            RbResponse plugin_call_raw(void *handle, uint32_t message_id,
+                                       const void *request, size_t request_size)
+            void rb_response_free(RbResponse *response)
+
+        The binary transport entries are only present when the library exports them.
+
+        Returns:
+            Mapping of symbol name to function address.
+        """
+        self._throw_if_disposed()
+        names = ["plugin_call", "plugin_free_buffer"]
+        if self._library.has_binary_transport:
+            names += ["plugin_call_raw", "rb_response_free"]
+        return {name: self._library.function_address(name) for name in names}
+
     def call(self, type_tag: str, request: str) -> str:
         """
         Make a call to the plugin with JSON request/response.
@@ -101,21 +148,146 @@ class NativePlugin:
             request: JSON request payload.
 
         Returns:
-            JSON response payload.
+            JSON response payload, compact with non-ASCII characters unescaped.
 
         Raises:
             PluginException: If the call fails or plugin is disposed.
         """
         self._throw_if_disposed()
 
+        type_tag_bytes = self._type_tag_cache.get(type_tag) or self._encode_type_tag(type_tag)
         request_bytes = request.encode("utf-8")
-        buffer = self._library.plugin_call(self._handle, type_tag, request_bytes)
+        buffer = self._library.plugin_call(self._handle, type_tag_bytes, request_bytes)
 
         try:
             return self._parse_result_buffer(buffer)
         finally:
             self._library.plugin_free_buffer(buffer)
 
+    def warm(self, type_tags: Iterable[str]) -> None:
+        """
+        Pre-encode message type tags so the first call of each skips the encoding.
+
+        Calls cache type tag encodings on first use anyway; warming is useful for
+        applications that know their message types up front.
+
+        Args:
+            type_tags: Message type identifiers to prepare.
+        """
+        for type_tag in type_tags:
+            self._type_tag_cache[type_tag] = type_tag.encode("utf-8")
+
+    def specialize(self, type_tag: str) -> Callable[[str], str]:
+        """
+        Create a call function bound to a single message type.
+
+        The returned function behaves like `call(type_tag, request)`, but the type
+        tag is encoded once and the native entry points are resolved up front, so
+        each invocation skips that per-call work. Use it for hot message types
+        called in tight loops.
+
+        Args:
+            type_tag: Message type identifier (e.g., "echo", "user.create").
+
+        Returns:
+            A function taking a JSON request and returning the JSON response payload.
+
+        Example:
+            echo = plugin.specialize("echo")
+            for message in messages:
+                response = echo(message)
+        """
+        library = self._library
+        handle = self._handle
+        plugin_call = library.plugin_call
+        free_buffer = library.plugin_free_buffer
+        parse_result = self._parse_result_buffer
+        type_tag_bytes = self._encode_type_tag(type_tag)
+
+        def call(request: str) -> str:
+            if self._disposed:
+                raise PluginException("Plugin has been closed")
+            buffer = plugin_call(handle, type_tag_bytes, request.encode("utf-8"))
+            try:
+                return parse_result(buffer)
+            finally:
+                free_buffer(buffer)
+
+        return call
+
+    def call_bytes(self, type_tag: str, request: bytes | bytearray | memoryview) -> bytes:
+        """
+        Make a call to the plugin with UTF-8 encoded JSON request/response bytes.
+
+        This is the bytes-level counterpart of call(). Use it when the request is
+        already serialized (e.g., read from a socket or produced by a JSON library
+        that emits bytes) to skip the str encode/decode steps that call() performs.
+
+        Args:
+            type_tag: Message type identifier (e.g., "echo", "user.create").
+            request: UTF-8 encoded JSON request payload.
+
+        Returns:
+            UTF-8 encoded JSON response payload.
+
+        Raises:
+            PluginException: If the call fails or plugin is disposed.
+        """
+        self._throw_if_disposed()
+
+        type_tag_bytes = self._type_tag_cache.get(type_tag) or self._encode_type_tag(type_tag)
+        buffer = self._library.plugin_call(self._handle, type_tag_bytes, request)
+
+        try:
+            return _dumps_json(self._parse_payload(buffer), parsed=True)
+        finally:
+            self._library.plugin_free_buffer(buffer)
+
+    def call_many(
+        self, type_tag: str, requests: Iterable[bytes | bytearray | memoryview]
+    ) -> list[bytes]:
+        """
+        Make a sequence of calls of one message type with JSON request bytes.
+
+        Equivalent to calling call_bytes() for each request, but the type tag
+        encoding, native entry point lookup and per-call setup are done once for
+        the whole sequence. Calls are made in order; the first failing call raises
+        and the remaining requests are not sent.
+
+        Args:
+            type_tag: Message type identifier (e.g., "echo", "user.create").
+            requests: UTF-8 encoded JSON request payloads.
+
+        Returns:
+            UTF-8 encoded JSON response payloads, in request order.
+
+        Raises:
+            PluginException: If any call fails or the plugin is disposed.
+        """
+        self._throw_if_disposed()
+
+        handle = self._handle
+        plugin_call = self._library.plugin_call
+        free_buffer = self._library.plugin_free_buffer
+        parse_payload = self._parse_payload
+        type_tag_bytes = self._type_tag_cache.get(type_tag) or self._encode_type_tag(type_tag)
+
+        responses: list[bytes] = []
+        append = responses.append
+        for request in requests:
+            if self._disposed:
+                raise PluginException("Plugin has been closed")
+
+            buffer = plugin_call(handle, type_tag_bytes, request)
+            try:
+                payload = parse_payload(buffer)
+            finally:
+                free_buffer(buffer)
+
+            append(_dumps_json(payload, parsed=True))
+
+        return responses
+
     def call_typed(
         self, type_tag: str, request: Any, response_type: type[T] | None = None
     ) -> T | Any:
@@ -132,10 +304,19 @@ class NativePlugin:
 
         Raises:
             PluginException: If the call fails.
+            ValueError: If the request holds a NaN or infinite float.
         """
-        request_json = json.dumps(request)
-        response_json = self.call(type_tag, request_json)
-        return json.loads(response_json)
+        self._throw_if_disposed()
+
+        type_tag_bytes = self._type_tag_cache.get(type_tag) or self._encode_type_tag(type_tag)
+        buffer = self._library.plugin_call(self._handle, type_tag_bytes, _dumps_json(request))
+
+        # The payload is already the decoded response; no need to serialize it
+        # back to JSON only to parse it again
+        try:
+            return self._parse_payload(buffer)
+        finally:
+            self._library.plugin_free_buffer(buffer)
 
     def call_raw(
         self,
@@ -218,11 +399,13 @@ class NativePlugin:
                     f"Response size mismatch: expected {expected_size}, got {rb_response.len}"
                 )
 
-            # Create response struct and copy data into it
-            response = response_type()
-            memmove(addressof(response), rb_response.data, expected_size)
+            if not expected_size:
+                return response_type()  # Nothing to copy; data may be null
 
-            return response
+            # Copy the data into a new response struct in one step, without
+            # zero-initializing it first
+            data = (c_uint8 * expected_size).from_address(addressof(rb_response.data.contents))
+            return response_type.from_buffer_copy(data)
         finally:
             # Free the response
             self._library.rb_response_free(rb_response)
@@ -265,7 +448,15 @@ class NativePlugin:
         self.shutdown()
 
     def _parse_result_buffer(self, buffer: Any) -> str:
-        """Parse the result buffer and extract the payload."""
+        """Parse the result buffer and extract the payload as JSON."""
+        return _dumps_json(self._parse_payload(buffer), parsed=True).decode("utf-8")
+
+    def _parse_payload(self, buffer: Any) -> Any:
+        """
+        Parse the result buffer and extract the payload of a successful response.
+
+        Returns None for an empty buffer and raises for error responses.
+        """
         if buffer.is_error():
             error_message = "Unknown error"
             if not buffer.is_empty():
@@ -273,15 +464,19 @@ class NativePlugin:
             raise PluginException(error_message, buffer.error_code)
 
         if buffer.is_empty():
-            return "null"
-
-        response_json = buffer.get_string()
-        envelope = ResponseEnvelope.from_json(response_json)
-
-        if not envelope.is_success:
-            raise envelope.to_exception()
-
-        return envelope.get_payload_json()
+            return None
+
+        # Parse straight from a view of the native buffer, without copying or
+        # decoding it to str first; it is freed by the caller afterwards.
+        # Success responses skip building a ResponseEnvelope.
+        return ResponseEnvelope.parse_payload(buffer.as_memoryview())
+
+    def _encode_type_tag(self, type_tag: str) -> bytes:
+        """Encode a type tag as UTF-8, caching the result for subsequent calls."""
+        type_tag_bytes = type_tag.encode("utf-8")
+        if len(self._type_tag_cache) < _TYPE_TAG_CACHE_LIMIT:
+            self._type_tag_cache[type_tag] = type_tag_bytes
+        return type_tag_bytes
 
     def _throw_if_disposed(self) -> None:
         """Raise an exception if the plugin has been disposed."""
@@ -11,7 +11,7 @@ from typing import Callable
 from rustbridge.core.log_level import LogLevel
 from rustbridge.core.plugin_config import PluginConfig
 from rustbridge.core.plugin_exception import PluginException
-from rustbridge.native.library import NativeLibrary
+from rustbridge.native.library import NativeLibrary, prefetch_library
 from rustbridge.native.native_plugin import NativePlugin
 from rustbridge.native.structures import LogCallbackFnType
 
@@ -62,6 +62,19 @@ class NativePluginLoader:
             library_path, PluginConfig.defaults(), None
         )
 
+    @staticmethod
+    def prefetch(library_path: str | Path) -> None:
+        """
+        Start loading a library in the background ahead of the first load.
+
+        Call this early during startup when the plugin path is known; a later
+        load of the same path reuses the result instead of loading synchronously.
+
+        Args:
+            library_path: Path to the shared library.
+        """
+        prefetch_library(library_path)
+
     @staticmethod
     def load_with_config(
         library_path: str | Path,
@@ -1,6 +1,17 @@
 """ctypes structures for FFI interop."""
 
-from ctypes import CFUNCTYPE, POINTER, Structure, c_char_p, c_size_t, c_uint8, c_uint32, c_uint64
+from ctypes import (
+    CFUNCTYPE,
+    POINTER,
+    Structure,
+    addressof,
+    c_char_p,
+    c_size_t,
+    c_uint8,
+    c_uint32,
+    c_uint64,
+    string_at,
+)
 
 
 class FfiBuffer(Structure):
@@ -43,20 +54,38 @@ class FfiBuffer(Structure):
         """
         if self.is_empty():
             return b""
-        # Create bytes from the pointer and length
-        return bytes(self.data[: self.len])
+        # Single memcpy from the Rust allocation into a new bytes object
+        return string_at(self.data, self.len)
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Get a read-only, zero-copy view of the buffer data.
+
+        The view points directly at Rust-owned memory, so it is only valid until
+        `plugin_free_buffer` is called on this buffer. Copy the data (e.g., with
+        `bytes(view)`) if it must outlive the buffer.
+
+        Returns:
+            A memoryview over the buffer contents (empty if the buffer is empty).
+        """
+        if self.is_empty():
+            return memoryview(b"")
+        array = (c_uint8 * self.len).from_address(addressof(self.data.contents))
+        return memoryview(array).cast("B").toreadonly()
 
     def get_string(self, encoding: str = "utf-8") -> str:
         """
         Get the buffer data as a string.
 
+        Decodes directly from the native buffer without an intermediate bytes copy.
+
         Args:
             encoding: The string encoding to use.
 
         Returns:
             The buffer contents as a string.
         """
-        return self.get_bytes().decode(encoding)
+        return str(self.as_memoryview(), encoding)
 
 
 class RbResponse(Structure):
@@ -99,7 +128,7 @@ class RbResponse(Structure):
         """Get the response data as bytes."""
         if not self.data or self.len == 0:
             return b""
-        return bytes(self.data[: self.len])
+        return string_at(self.data, self.len)
 
     def get_error_message(self) -> str:
         """Get error message if this is an error response."""
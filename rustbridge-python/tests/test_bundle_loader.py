@@ -1,16 +1,32 @@
 """Tests for BundleLoader."""
 
+import base64
 import hashlib
 import io
 import json
+import mmap
+import os
 import platform
 import tempfile
+import tracemalloc
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from rustbridge import BundleLoader, BundleManifest, PlatformInfo, SchemaInfo, PluginException
+from rustbridge import BundleLoader, BundleManifest, PlatformInfo, PluginException, SchemaInfo
+from rustbridge.core.bundle_manifest import VariantInfo
+
+
+@pytest.fixture
+def restrictive_umask() -> Iterator[None]:
+    """Run a test with umask 077, restoring the previous umask afterwards."""
+    previous = os.umask(0o077)
+    try:
+        yield
+    finally:
+        os.umask(previous)
 
 
 class TestBundleLoader:
@@ -40,12 +56,28 @@ class TestBundleLoader:
 
         assert result == "windows-x86_64"
 
+    def test_get_current_platform___repeated___returns_same_string(self) -> None:
+        first = BundleLoader.get_current_platform()
+
+        assert BundleLoader.get_current_platform() is first
+
     def test_load___file_not_found___raises_file_not_found(self) -> None:
         loader = BundleLoader(verify_signatures=False)
 
         with pytest.raises(FileNotFoundError):
             loader.load("/nonexistent/path/bundle.rbp")
 
+    def test_extract_library_to_temp___file_not_found___leaves_no_temp_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(FileNotFoundError, match="Bundle not found"):
+            loader.extract_library_to_temp(tmp_path / "missing.rbp")
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestBundleManifest:
     """Tests for BundleManifest parsing."""
@@ -109,6 +141,32 @@ class TestBundleManifest:
         with pytest.raises(PluginException, match="Failed to parse"):
             BundleManifest.from_json("not valid json")
 
+    def test_from_json___utf8_bytes___parses_correctly(self) -> None:
+        manifest_json = json.dumps({
+            "bundle_version": "1.0",
+            "plugin": {"name": "tëst", "version": "1.0.0"},
+            "platforms": {},
+        }).encode("utf-8")
+
+        manifest = BundleManifest.from_json(manifest_json)
+
+        assert manifest.plugin_name == "tëst"
+
+    def test_from_bytes___utf8_bytes___parses_correctly(self) -> None:
+        manifest_data = json.dumps({
+            "bundle_version": "1.0",
+            "plugin": {"name": "tëst", "version": "1.0.0"},
+            "platforms": {},
+        }).encode("utf-8")
+
+        manifest = BundleManifest.from_bytes(manifest_data)
+
+        assert manifest.plugin_name == "tëst"
+
+    def test_from_json___invalid_utf8_bytes___raises_exception(self) -> None:
+        with pytest.raises(PluginException, match="Failed to parse"):
+            BundleManifest.from_json(b'{"bundle_version": "\xff"}')
+
     def test_get_platform___existing___returns_platform_info(self) -> None:
         manifest_json = json.dumps({
             "bundle_version": "1.0",
@@ -139,6 +197,128 @@ class TestBundleManifest:
 
         assert manifest.get_platform("linux-x86_64") is None
 
+    def test_resolve___variants___matches_get_library_and_checksum(self) -> None:
+        manifest = BundleManifest.from_json(json.dumps({
+            "bundle_version": "2.0",
+            "plugin": {"name": "test", "version": "1.0.0"},
+            "platforms": {
+                "linux-x86_64": {
+                    "library": "lib/linux-x86_64/release/libtest.so",
+                    "checksum": "sha256:AA",
+                    "default_variant": "release",
+                    "variants": {
+                        "release": {
+                            "library": "lib/linux-x86_64/release/libtest.so",
+                            "checksum": "sha256:aa",
+                        },
+                        "debug": {
+                            "library": "lib/linux-x86_64/debug/libtest.so",
+                            "checksum": "bb",
+                        },
+                    },
+                }
+            },
+        }))
+        platform_info = manifest.get_platform("linux-x86_64")
+        assert platform_info is not None
+
+        for variant in (None, "release", "debug", "missing"):
+            entry = manifest.resolve("linux-x86_64", variant)
+            effective = variant or platform_info.get_default_variant()
+
+            assert entry is not None
+            assert entry.library == platform_info.get_library(effective)
+            assert entry.checksum == platform_info.get_checksum(effective)
+            assert entry.signature_path == entry.library + ".minisig"
+
+    def test_resolve___variants_only___resolves_release_by_default(self) -> None:
+        platform_info = PlatformInfo(
+            library="",
+            checksum="",
+            variants={
+                "release": VariantInfo(library="lib/release/libtest.so", checksum="aa"),
+                "debug": VariantInfo(library="lib/debug/libtest.so", checksum="bb"),
+            },
+        )
+
+        entry = platform_info.resolve()
+        missing = platform_info.resolve("missing")
+
+        assert (entry.library, entry.checksum) == ("lib/release/libtest.so", "aa")
+        assert (missing.library, missing.checksum) == ("", "")
+
+    def test_resolve___fields_changed_after_creation___reflects_changes(self) -> None:
+        platform_info = PlatformInfo(library="lib/a.so", checksum="aa")
+
+        platform_info.library = "lib/b.so"
+        platform_info.variants["debug"] = VariantInfo(library="lib/debug.so", checksum="bb")
+
+        assert platform_info.get_library("release") == "lib/b.so"
+        assert platform_info.resolve().library == "lib/b.so"
+        assert platform_info.get_library("debug") == "lib/debug.so"
+        assert platform_info.resolve("debug").checksum_bytes == b"\xbb"
+
+    def test_checksum_bytes___checksum_changed___reflects_change(self) -> None:
+        schema_info = SchemaInfo(path="schemas/api.json", checksum="sha256:aa")
+
+        schema_info.checksum = "sha256:bb"
+
+        assert schema_info.checksum_bytes == b"\xbb"
+
+    def test_checksum_bytes___repeated_access___decodes_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rustbridge.core import bundle_manifest
+
+        schema_info = SchemaInfo(path="schemas/api.json", checksum="sha256:aa")
+        calls: list[str] = []
+        monkeypatch.setattr(
+            bundle_manifest, "parse_checksum", lambda checksum: calls.append(checksum)
+        )
+
+        for _ in range(3):
+            assert schema_info.checksum_bytes == b"\xaa"
+
+        assert calls == []
+
+    def test_get_library___variants___returns_variant_or_platform_entry(self) -> None:
+        platform_info = PlatformInfo(
+            library="lib/libtest.so",
+            checksum="sha256:aa",
+            variants={"debug": VariantInfo(library="lib/debug/libtest.so", checksum="bb")},
+        )
+
+        assert platform_info.get_library("debug") == "lib/debug/libtest.so"
+        assert platform_info.get_checksum("debug") == "bb"
+        assert platform_info.get_library("release") == "lib/libtest.so"
+        assert platform_info.get_checksum("release") == "sha256:aa"
+
+    def test_schema_info___checksum_formats___decodes_raw_digest(self) -> None:
+        upper = SchemaInfo(path="schemas/a.h", checksum="SHA256:ABCD")
+        bare = SchemaInfo(path="schemas/a.h", checksum="abcd")
+        invalid = SchemaInfo(path="schemas/a.h", checksum="sha256:not-hex")
+
+        assert upper.checksum_bytes == b"\xab\xcd"
+        assert bare.checksum_bytes == b"\xab\xcd"
+        assert invalid.checksum_bytes is None
+        assert upper == SchemaInfo(path="schemas/a.h", checksum="SHA256:ABCD")
+
+    def test_resolve___checksum_formats___decodes_raw_digest(self) -> None:
+        manifest = BundleManifest.from_json(json.dumps({
+            "bundle_version": "1.0",
+            "plugin": {"name": "test", "version": "1.0.0"},
+            "platforms": {
+                "upper": {"library": "a.so", "checksum": "SHA256:ABCD"},
+                "bare": {"library": "b.so", "checksum": "abcd"},
+                "bad": {"library": "c.so", "checksum": "sha256:xyz"},
+            },
+        }))
+
+        assert manifest.resolve("upper").checksum_bytes == b"\xab\xcd"
+        assert manifest.resolve("bare").checksum_bytes == b"\xab\xcd"
+        assert manifest.resolve("bad").checksum_bytes is None
+        assert manifest.resolve("windows-x86_64") is None
+
     def test_from_json___with_schemas___parses_schemas(self) -> None:
         manifest_json = json.dumps({
             "bundle_version": "1.0",
@@ -167,15 +347,38 @@ class TestBundleManifest:
         assert manifest.schemas["messages.h"].format == "c-header"
         assert manifest.schemas["api.json"].checksum == "sha256:def456"
 
+    def test_from_json___parsed_objects___have_no_instance_dict(self) -> None:
+        manifest_json = json.dumps({
+            "bundle_version": "1.0",
+            "plugin": {"name": "test", "version": "1.0.0"},
+            "platforms": {
+                "linux-x86_64": {
+                    "library": "lib/linux-x86_64/libtest.so",
+                    "checksum": "sha256:abc123",
+                }
+            },
+            "schemas": {
+                "api.json": {"path": "schemas/api.json", "checksum": "sha256:def456"},
+            },
+        })
+
+        manifest = BundleManifest.from_json(manifest_json)
+
+        assert not hasattr(manifest, "__dict__")
+        assert not hasattr(manifest.platforms["linux-x86_64"], "__dict__")
+        assert not hasattr(manifest.schemas["api.json"], "__dict__")
+
 
 def _create_test_bundle_with_schemas(
     schemas: dict[str, str],
+    compression: int = zipfile.ZIP_DEFLATED,
 ) -> tuple[bytes, dict[str, str]]:
     """
     Create a test bundle ZIP with the given schemas.
 
     Args:
         schemas: Dictionary mapping schema name to schema content.
+        compression: Compression method for the schema entries.
 
     Returns:
         Tuple of (zip_bytes, checksums) where checksums maps schema name to its SHA256.
@@ -183,7 +386,7 @@ def _create_test_bundle_with_schemas(
     buffer = io.BytesIO()
     checksums: dict[str, str] = {}
 
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(buffer, "w", compression) as zf:
         # Calculate checksums and add schema files
         schema_manifest: dict[str, dict[str, str]] = {}
         for name, content in schemas.items():
@@ -316,9 +519,11 @@ class TestBundleLoaderSchemas:
         try:
             loader = BundleLoader(verify_signatures=False)
 
-            with tempfile.TemporaryDirectory() as dest_dir:
-                with pytest.raises(PluginException, match="Schema not found"):
-                    loader.extract_schema(bundle_path, "nonexistent.h", dest_dir)
+            with (
+                tempfile.TemporaryDirectory() as dest_dir,
+                pytest.raises(PluginException, match="Schema not found"),
+            ):
+                loader.extract_schema(bundle_path, "nonexistent.h", dest_dir)
         finally:
             bundle_path.unlink()
 
@@ -346,6 +551,248 @@ class TestBundleLoaderSchemas:
             bundle_path.unlink()
 
 
+    def test_read_schema___stored_entry___returns_content(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas(
+            {"api.json": '{"title": "héllo"}'}, compression=zipfile.ZIP_STORED
+        )
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        result = loader.read_schema(bundle_path, "api.json")
+
+        assert result == '{"title": "héllo"}'
+
+    def test_read_schema___large_deflated_schema___returns_content_within_two_copies(
+        self, tmp_path: Path
+    ) -> None:
+        content = "".join(f"// generated binding {i:08d}\n" for i in range(128 * 1024))
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"bindings.h": content})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        tracemalloc.start()
+        try:
+            result = loader.read_schema(bundle_path, "bindings.h")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result == content
+        # The decoded string plus one buffer of the entry, no transient extra copy
+        assert peak < 2.2 * len(content)
+
+    def test_read_schema___stored_entry_corrupted___raises_exception(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas(
+            {"api.json": "original"}, compression=zipfile.ZIP_STORED
+        )
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes.replace(b"original", b"tampered"))
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.read_schema(bundle_path, "api.json")
+
+    def test_extract_schema___corrupted_checksum___leaves_no_file(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"test.txt": "test content"})
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/test.txt", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_schema(bundle_path, "test.txt", tmp_path)
+
+        assert not (tmp_path / "test.txt").exists()
+
+    def test_extract_schema___corrupted_checksum___keeps_existing_file(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"test.txt": "test content"})
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/test.txt", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        existing = tmp_path / "test.txt"
+        existing.write_text("user content")
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_schema(bundle_path, "test.txt", tmp_path)
+
+        assert existing.read_text() == "user content"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["bundle.rbp", "test.txt"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_extract_schema___overwrite_under_restrictive_umask___keeps_mode(
+        self, tmp_path: Path, restrictive_umask: None
+    ) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"test.txt": "test content"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        existing = tmp_path / "test.txt"
+        existing.write_bytes(b"stale")
+        existing.chmod(0o600)
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_schema(bundle_path, "test.txt", tmp_path)
+
+        assert output_path.read_text() == "test content"
+        assert output_path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_extract_schema___output___is_not_executable(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"test.txt": "test content"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_schema(bundle_path, "test.txt", tmp_path)
+
+        assert not output_path.stat().st_mode & 0o111
+
+    def test_extract_schemas___all___extracts_every_schema(self, tmp_path: Path) -> None:
+        schemas = {"messages.h": "struct A {};", "api.json": "{}", "bindings.rs": "// rs"}
+        bundle_bytes, _ = _create_test_bundle_with_schemas(schemas)
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        result = loader.extract_schemas(bundle_path, tmp_path)
+
+        assert set(result) == set(schemas)
+        for name, content in schemas.items():
+            assert result[name].read_text() == content
+
+    def test_extract_schemas___names___extracts_only_those(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a", "b.h": "b"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        result = loader.extract_schemas(bundle_path, tmp_path, ["b.h"])
+
+        assert list(result) == ["b.h"]
+        assert not (tmp_path / "a.h").exists()
+
+    def test_extract_schemas___unknown_name___raises_before_writing(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Schema not found"):
+            loader.extract_schemas(bundle_path, tmp_path, ["a.h", "missing.h"])
+
+        assert not (tmp_path / "a.h").exists()
+
+    def test_extract_schemas___corrupted_schema___leaves_no_files(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a", "b.h": "b"})
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/b.h", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_schemas(bundle_path, tmp_path)
+
+        assert not (tmp_path / "a.h").exists()
+        assert not (tmp_path / "b.h").exists()
+
+    def test_extract_schemas___concurrent___extracts_every_schema(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        schemas = {f"schema-{i}.json": "{}" * (i + 1) for i in range(12)}
+        bundle_bytes, _ = _create_test_bundle_with_schemas(schemas)
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        monkeypatch.setattr("rustbridge.core.bundle_loader._PARALLEL_SCHEMA_BYTES", 0)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        loader = BundleLoader(verify_signatures=False)
+
+        result = loader.extract_schemas(bundle_path, tmp_path, [*schemas, "schema-0.json"])
+
+        assert set(result) == set(schemas)
+        for name, content in schemas.items():
+            assert result[name].read_text() == content
+
+    def test_extract_schemas___concurrent_corrupted_schema___leaves_no_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        schemas = {f"schema-{i}.json": "{}" for i in range(12)}
+        bundle_bytes, _ = _create_test_bundle_with_schemas(schemas)
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/schema-5.json", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        monkeypatch.setattr("rustbridge.core.bundle_loader._PARALLEL_SCHEMA_BYTES", 0)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_schemas(bundle_path, out_dir)
+
+        assert list(out_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("parallel_bytes", [0, 1 << 30])
+    def test_extract_schemas___corrupted_schema___keeps_existing_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, parallel_bytes: int
+    ) -> None:
+        schemas = {f"schema-{i}.json": "{}" for i in range(6)}
+        bundle_bytes, _ = _create_test_bundle_with_schemas(schemas)
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/schema-5.json", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        for name in schemas:
+            (out_dir / name).write_text("user content")
+        monkeypatch.setattr("rustbridge.core.bundle_loader._PARALLEL_SCHEMA_BYTES", parallel_bytes)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_schemas(bundle_path, out_dir)
+
+        assert sorted(path.name for path in out_dir.iterdir()) == sorted(schemas)
+        for name in schemas:
+            assert (out_dir / name).read_text() == "user content"
+
+    def test_verify_schemas___valid_bundle___writes_nothing(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a", "b.json": "{}"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+
+        loader.verify_schemas(bundle_path)
+
+        assert list(tmp_path.iterdir()) == [bundle_path]
+
+    def test_verify_schemas___corrupted_schema___raises_exception(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a", "b.h": "b"})
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr("schemas/b.h", "corrupted content")
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        loader = BundleLoader(verify_signatures=False)
+
+        loader.verify_schemas(bundle_path, ["a.h"])
+        with pytest.raises(PluginException, match="schema b.h"):
+            loader.verify_schemas(bundle_path)
+
+
 class TestBundleLoaderEdgeCases:
     """Tests for BundleLoader error handling with corrupted or malformed bundles."""
 
@@ -472,3 +919,806 @@ class TestBundleLoaderEdgeCases:
                 loader.load(bundle_path)
         finally:
             bundle_path.unlink()
+
+
+    def test_read_entry_hashed___forged_huge_size___raises_without_allocating(self) -> None:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("lib/libtest.so", b"tiny")
+        with zipfile.ZipFile(buffer) as zf:
+            info = zf.getinfo("lib/libtest.so")
+            info.file_size = 1 << 40
+
+            with pytest.raises(PluginException, match="Truncated entry"):
+                BundleLoader._read_entry_hashed(zf, info)
+
+    def test_read_entry_hashed___entry_beyond_preallocation___reads_whole_entry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rustbridge.core import bundle_loader
+
+        content = bytes(range(256)) * 400
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("lib/libtest.so", content)
+        monkeypatch.setattr(bundle_loader, "_INFLATE_PREALLOCATE_LIMIT", 1000)
+
+        with zipfile.ZipFile(buffer) as zf:
+            data, digest = BundleLoader._read_entry_hashed(zf, zf.getinfo("lib/libtest.so"))
+
+        assert data == content
+        assert digest == hashlib.sha256(content).digest()
+
+class TestBundleLoaderOpenZip:
+    """Tests for the memory-mapped bundle access used by every BundleLoader entry point."""
+
+    def test_open_zip___valid_bundle___reads_entries(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"schema.json": '{"type": "object"}'})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+
+        with BundleLoader._open_zip(bundle_path) as zip_file:
+            content = zip_file.read("schemas/schema.json")
+
+        assert content == b'{"type": "object"}'
+
+    def test_open_zip___after_exit___releases_mapping(self, tmp_path: Path) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+
+        with BundleLoader._open_zip(bundle_path) as zip_file:
+            mapped = zip_file.fp
+
+        assert mapped is not None
+        assert mapped.closed
+
+    def test_open_zip___not_a_zip___closes_mapping(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rustbridge.core import bundle_loader
+
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(b"not a zip archive")
+        mappings: list[mmap.mmap] = []
+
+        class RecordingMappedFile(bundle_loader._MappedFile):
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                mappings.append(self)
+
+        monkeypatch.setattr(bundle_loader, "_MappedFile", RecordingMappedFile)
+
+        with pytest.raises(zipfile.BadZipFile), BundleLoader._open_zip(bundle_path):
+            pass
+
+        assert len(mappings) == 1
+        assert mappings[0].closed
+
+    def test_open_zip___empty_file___raises_bad_zip_file(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "empty.rbp"
+        bundle_path.touch()
+
+        with pytest.raises(zipfile.BadZipFile), BundleLoader._open_zip(bundle_path):
+            pass
+
+
+LIBRARY_BYTES = b"\x7fELF" + bytes(range(256)) * 64
+
+
+BRIDGE_BYTES = b"\x7fELF" + bytes(range(255, -1, -1)) * 32
+
+
+def _create_library_bundle(
+    compression: int,
+    checksum: str | None = None,
+    *,
+    with_jni_bridge: bool = False,
+    bridge_checksum: str | None = None,
+    bridge_path: str = "bridge/jni/current/libtest_jni.so",
+) -> bytes:
+    """Create a bundle containing a library (and optionally a JNI bridge) for this platform."""
+    library_path = "lib/current/libtest.so"
+    checksum = checksum or f"sha256:{hashlib.sha256(LIBRARY_BYTES).hexdigest()}"
+    bridge_checksum = bridge_checksum or f"sha256:{hashlib.sha256(BRIDGE_BYTES).hexdigest()}"
+    manifest = {
+        "bundle_version": "1.0",
+        "plugin": {"name": "test-plugin", "version": "1.0.0"},
+        "platforms": {
+            BundleLoader.get_current_platform(): {
+                "library": library_path,
+                "checksum": checksum,
+            }
+        },
+    }
+    if with_jni_bridge:
+        manifest["bridges"] = {
+            "jni": {
+                BundleLoader.get_current_platform(): {
+                    "library": bridge_path,
+                    "checksum": bridge_checksum,
+                }
+            }
+        }
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("manifest.json", json.dumps(manifest), compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr(library_path, LIBRARY_BYTES, compress_type=compression)
+        if with_jni_bridge:
+            zf.writestr(bridge_path, BRIDGE_BYTES, compress_type=compression)
+    return buffer.getvalue()
+
+
+def _create_signed_library_bundle(
+    compression: int, library: bytes, checksummed: bytes, *, prehashed: bool = True
+) -> bytes:
+    """
+    Create a bundle whose manifest and library are signed with one fresh key.
+
+    The manifest checksum is computed over `checksummed`, which lets a test ship a
+    validly signed library that is not the one the manifest names. With
+    `prehashed=False` the library gets a legacy (non-prehashed) signature.
+    """
+    from nacl.signing import SigningKey
+
+    signing_key = SigningKey.generate()
+    key_id = b"\x11\x22\x33\x44\x55\x66\x77\x88"
+    public_key = base64.b64encode(b"Ed" + key_id + bytes(signing_key.verify_key)).decode()
+
+    def sign(data: bytes, prehashed: bool = True) -> str:
+        if prehashed:
+            algorithm_id, data = b"ED", hashlib.blake2b(data, digest_size=64).digest()
+        else:
+            algorithm_id = b"Ed"
+        raw = base64.b64encode(algorithm_id + key_id + signing_key.sign(data).signature).decode()
+        return f"untrusted comment: test\n{raw}\ntrusted comment: test\n"
+
+    library_path = "lib/current/libtest.so"
+    manifest = json.dumps({
+        "bundle_version": "1.0",
+        "plugin": {"name": "test-plugin", "version": "1.0.0"},
+        "public_key": public_key,
+        "platforms": {
+            BundleLoader.get_current_platform(): {
+                "library": library_path,
+                "checksum": f"sha256:{hashlib.sha256(checksummed).hexdigest()}",
+            }
+        },
+    }).encode("utf-8")
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("manifest.json", manifest)
+        zf.writestr("manifest.json.minisig", sign(manifest))
+        zf.writestr(library_path, library, compress_type=compression)
+        zf.writestr(library_path + ".minisig", sign(library, prehashed))
+    return buffer.getvalue()
+
+
+class TestBundleLoaderSignedExtraction:
+    """Tests for library extraction with signature verification enabled."""
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___valid_signatures___writes_library(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_bytes = _create_signed_library_bundle(compression, LIBRARY_BYTES, LIBRARY_BYTES)
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=True)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___legacy_library_signature___writes_library(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_bytes = _create_signed_library_bundle(
+            compression, LIBRARY_BYTES, LIBRARY_BYTES, prehashed=False
+        )
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=True)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    @pytest.mark.parametrize("prehashed", [True, False])
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___tampered_library_signature___raises_and_leaves_no_file(
+        self, tmp_path: Path, compression: int, prehashed: bool
+    ) -> None:
+        bundle_bytes = _create_signed_library_bundle(
+            compression, LIBRARY_BYTES, LIBRARY_BYTES, prehashed=prehashed
+        )
+        signature_path = "lib/current/libtest.so.minisig"
+        with zipfile.ZipFile(io.BytesIO(bundle_bytes)) as zf:
+            lines = zf.read(signature_path).decode().split("\n")
+        raw = bytearray(base64.b64decode(lines[1]))
+        raw[-1] ^= 0x01
+        lines[1] = base64.b64encode(raw).decode()
+        buffer = io.BytesIO(bundle_bytes)
+        with zipfile.ZipFile(buffer, "a") as zf:
+            zf.writestr(signature_path, "\n".join(lines))
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(buffer.getvalue())
+        loader = BundleLoader(verify_signatures=True)
+
+        with pytest.raises(PluginException, match="Library signature verification failed"):
+            loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert not (tmp_path / "out" / "libtest.so").exists()
+
+    def test_extract_library___signed_deflated___does_not_reread_output(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rustbridge.core import bundle_loader
+
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(
+            _create_signed_library_bundle(zipfile.ZIP_DEFLATED, LIBRARY_BYTES, LIBRARY_BYTES)
+        )
+
+        def no_map_file(path: Path):
+            raise AssertionError(f"extracted library read back: {path}")
+
+        monkeypatch.setattr(bundle_loader, "_map_file", no_map_file)
+        loader = BundleLoader(verify_signatures=True)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    def test_extract_library___signed_bundle___parses_public_key_once(
+        self, tmp_path: Path
+    ) -> None:
+        from rustbridge.core import bundle_loader
+
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(
+            _create_signed_library_bundle(zipfile.ZIP_DEFLATED, LIBRARY_BYTES, LIBRARY_BYTES)
+        )
+        loader = BundleLoader(verify_signatures=True)
+        bundle_loader._get_verifier.cache_clear()
+
+        loader.extract_library(bundle_path, tmp_path / "a")
+        loader.extract_library(bundle_path, tmp_path / "b")
+
+        assert bundle_loader._get_verifier.cache_info().misses == 1
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___signed_library_not_in_manifest___raises_exception(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        # Same key, valid signature, but not the library the signed manifest names
+        swapped = LIBRARY_BYTES[::-1]
+        bundle_bytes = _create_signed_library_bundle(compression, swapped, LIBRARY_BYTES)
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=True)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert not (tmp_path / "out" / "libtest.so").exists()
+
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___large_signed_library___peak_memory_stays_bounded(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        library = bytes(range(256)) * (16 * 1024 * 1024 // 256)
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_signed_library_bundle(compression, library, library))
+        del library
+        loader = BundleLoader(verify_signatures=True)
+
+        tracemalloc.start()
+        try:
+            loader.extract_library(bundle_path, tmp_path / "out")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 4 * 1024 * 1024
+
+
+class TestBundleLoaderExtraction:
+    """Tests for library extraction."""
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___valid_bundle___writes_library(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression))
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+        if os.name != "nt":
+            assert output_path.stat().st_mode & 0o111
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___overwrites_plain_file___makes_it_executable(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression))
+        stale_path = tmp_path / "libtest.so"
+        stale_path.write_bytes(b"stale")
+        stale_path.chmod(0o644)
+        loader = BundleLoader(verify_signatures=False)
+
+        with loader.open_bundle(bundle_path) as zip_file:
+            output_path = loader._extract_library_internal(
+                zip_file, tmp_path, fail_if_exists=False
+            )
+
+        assert output_path == stale_path
+        assert output_path.read_bytes() == LIBRARY_BYTES
+        assert output_path.stat().st_mode & 0o777 == 0o755
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_extract_library___overwrite_existing_file___adds_exec_bits_to_its_mode(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        stale_path = tmp_path / "libtest.so"
+        stale_path.write_bytes(b"stale")
+        stale_path.chmod(0o600)
+        loader = BundleLoader(verify_signatures=False)
+
+        with loader.open_bundle(bundle_path) as zip_file:
+            output_path = loader._extract_library_internal(
+                zip_file, tmp_path, fail_if_exists=False
+            )
+
+        assert output_path.stat().st_mode & 0o777 == 0o711
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___checksum_mismatch___raises_and_leaves_no_file(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression, checksum="sha256:00"))
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert not (tmp_path / "out" / "libtest.so").exists()
+
+    @pytest.mark.parametrize(
+        "checksum",
+        [
+            "sha256:" + hashlib.sha256(LIBRARY_BYTES).hexdigest().upper(),
+            "SHA256:" + hashlib.sha256(LIBRARY_BYTES).hexdigest(),
+            hashlib.sha256(LIBRARY_BYTES).hexdigest(),
+        ],
+    )
+    def test_extract_library___checksum_formats___accepted(
+        self, tmp_path: Path, checksum: str
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED, checksum=checksum))
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    def test_extract_library___non_hex_checksum___raises_exception(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED, checksum="sha256:zz"))
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.extract_library(bundle_path, tmp_path / "out")
+
+    def test_extract_library___signature_check___reads_manifest_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED))
+        loader = BundleLoader(verify_signatures=True, public_key_override="unused")
+        read_paths: list[str] = []
+        read_zip_entry = BundleLoader._read_zip_entry
+
+        def recording_read(zip_file: zipfile.ZipFile, path: str) -> bytes:
+            read_paths.append(path)
+            return read_zip_entry(zip_file, path)
+
+        monkeypatch.setattr(BundleLoader, "_read_zip_entry", staticmethod(recording_read))
+
+        with pytest.raises(PluginException, match="minisig not found"):
+            loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert read_paths.count("manifest.json") == 1
+
+    def test_extract_library___no_kernel_copy___falls_back_to_read_write(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED))
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.setattr("sys.platform", "darwin")
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    def test_supports_platform___current_platform___returns_true(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False)
+
+        assert loader.supports_platform(bundle_path) is True
+
+    def test_supports_platform___other_platform___returns_false(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False)
+
+        assert loader.supports_platform(bundle_path, "plan9-mips") is False
+
+    def test_supports_platform___invalid_manifest___raises_exception(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        with zipfile.ZipFile(bundle_path, "w") as zf:
+            zf.writestr("manifest.json", "[1, 2")
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Failed to parse manifest"):
+            loader.supports_platform(bundle_path)
+
+    def test_supports_platform___non_utf8_manifest___raises_exception(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        with zipfile.ZipFile(bundle_path, "w") as zf:
+            zf.writestr("manifest.json", b'{"platforms": {"\xff": {}}}')
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="Failed to parse manifest"):
+            loader.supports_platform(bundle_path)
+
+    def test_extract_library___deflated_in_many_chunks___hashes_whole_library(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        monkeypatch.setattr("rustbridge.core.bundle_loader._INFLATE_CHUNK_SIZE", 1000)
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+
+class TestBundleLoaderManifestCache:
+    """Tests for the parsed manifest cache."""
+
+    def test_get_manifest___same_bundle_twice___returns_independent_equal_manifests(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False)
+
+        first = loader.get_manifest(bundle_path)
+        second = loader.get_manifest(str(bundle_path))
+
+        assert first is not second
+        assert first == second
+
+    def test_get_manifest___returned_manifest_modified___extraction_unaffected(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"api.json": '{"a": 1}'})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+        loader.read_schema(bundle_path, "api.json")
+
+        manifest = loader.get_manifest(bundle_path)
+        manifest.schemas["api.json"].checksum = "sha256:" + "00" * 32
+        manifest.schemas["api.json"].path = "manifest.json"
+
+        assert loader.read_schema(bundle_path, "api.json") == '{"a": 1}'
+        assert loader.get_manifest(bundle_path).schemas["api.json"].path == "schemas/api.json"
+
+    def test_get_manifest___bundle_rewritten___returns_fresh_manifest(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False)
+        first = loader.get_manifest(bundle_path)
+
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"api.json": "{}"})
+        bundle_path.write_bytes(bundle_bytes)
+        second = loader.get_manifest(bundle_path)
+
+        assert second is not first
+        assert "api.json" in second.schemas
+
+    def test_get_manifest___many_bundles___keeps_cache_bounded(self, tmp_path: Path) -> None:
+        loader = BundleLoader(verify_signatures=False)
+        bundle_bytes = _create_library_bundle(zipfile.ZIP_DEFLATED)
+
+        for i in range(20):
+            bundle_path = tmp_path / f"bundle-{i}.rbp"
+            bundle_path.write_bytes(bundle_bytes)
+            loader.get_manifest(bundle_path)
+
+        assert len(loader._manifest_cache) == 16
+
+    def test_read_schema___several_reads___parse_manifest_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_bytes, _ = _create_test_bundle_with_schemas({"a.h": "a", "b.h": "b"})
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(bundle_bytes)
+        loader = BundleLoader(verify_signatures=False)
+        parsed: list[bytes] = []
+        from_json = BundleManifest.from_json
+
+        def counting_from_json(json_str: str | bytes) -> BundleManifest:
+            parsed.append(json_str)
+            return from_json(json_str)
+
+        monkeypatch.setattr(BundleManifest, "from_json", staticmethod(counting_from_json))
+
+        loader.has_jni_bridge(bundle_path)
+        loader.read_schema(bundle_path, "a.h")
+        loader.read_schema(bundle_path, "b.h")
+        loader.extract_schema(bundle_path, "a.h", tmp_path)
+
+        assert len(parsed) == 1
+
+
+class TestBundleLoaderStreaming:
+    """Tests that library extraction never materializes the whole library in memory."""
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___any_compression___never_reads_whole_entry(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression))
+        original_read = zipfile.ZipFile.read
+
+        def guarded_read(self: zipfile.ZipFile, name: str | zipfile.ZipInfo, pwd=None) -> bytes:
+            entry = name.filename if isinstance(name, zipfile.ZipInfo) else name
+            assert not entry.endswith(".so"), "library entry read into memory"
+            return original_read(self, name, pwd)
+
+        monkeypatch.setattr(zipfile.ZipFile, "read", guarded_read)
+        loader = BundleLoader(verify_signatures=False)
+
+        output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_library___large_library___peak_memory_stays_bounded(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        library = bytes(range(256)) * (32 * 1024 * 1024 // 256)
+        manifest = {
+            "bundle_version": "1.0",
+            "plugin": {"name": "test-plugin", "version": "1.0.0"},
+            "platforms": {
+                BundleLoader.get_current_platform(): {
+                    "library": "lib/current/libbig.so",
+                    "checksum": f"sha256:{hashlib.sha256(library).hexdigest()}",
+                }
+            },
+        }
+        bundle_path = tmp_path / "bundle.rbp"
+        with zipfile.ZipFile(bundle_path, "w") as zf:
+            zf.writestr("manifest.json", json.dumps(manifest))
+            zf.writestr("lib/current/libbig.so", library, compress_type=compression)
+        del library
+        loader = BundleLoader(verify_signatures=False)
+
+        tracemalloc.start()
+        try:
+            loader.extract_library(bundle_path, tmp_path / "out")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 8 * 1024 * 1024
+
+
+class TestBundleLoaderOpenBundle:
+    """Tests for reusing one open bundle across calls."""
+
+    def test_open_bundle___nested_calls___open_archive_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED))
+        loader = BundleLoader(verify_signatures=False)
+        opened: list[str] = []
+        open_zip = BundleLoader._open_zip
+
+        def counting_open_zip(path: str | Path):
+            opened.append(str(path))
+            return open_zip(path)
+
+        monkeypatch.setattr(BundleLoader, "_open_zip", staticmethod(counting_open_zip))
+
+        with loader.open_bundle(bundle_path):
+            files = loader.list_files(bundle_path)
+            supported = loader.supports_platform(bundle_path)
+            output_path = loader.extract_library(bundle_path, tmp_path / "out")
+
+        assert len(opened) == 1
+        assert "manifest.json" in files
+        assert supported
+        assert output_path.read_bytes() == LIBRARY_BYTES
+
+    def test_open_bundle___after_block___reopens_archive(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED))
+        loader = BundleLoader(verify_signatures=False)
+        with loader.open_bundle(bundle_path) as zip_file:
+            pass
+
+        assert zip_file.fp is None
+        assert "manifest.json" in loader.list_files(bundle_path)
+
+    def test_open_bundle___yields_archive_named_after_bundle(self, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_STORED))
+        loader = BundleLoader(verify_signatures=False)
+
+        with loader.open_bundle(bundle_path) as zip_file:
+            assert zip_file.filename == str(bundle_path)
+
+
+class TestBundleLoaderExtractAll:
+    """Tests for extracting the library and JNI bridge together."""
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_extract_all___with_jni_bridge___writes_both(
+        self, tmp_path: Path, compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression, with_jni_bridge=True))
+        loader = BundleLoader(verify_signatures=False)
+
+        library, bridge = loader.extract_all(bundle_path, tmp_path / "out")
+
+        assert library.read_bytes() == LIBRARY_BYTES
+        assert bridge is not None
+        assert bridge.read_bytes() == BRIDGE_BYTES
+
+    def test_extract_all___without_jni_bridge___returns_none_for_bridge(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False)
+
+        library, bridge = loader.extract_all(bundle_path, tmp_path / "out")
+
+        assert library.read_bytes() == LIBRARY_BYTES
+        assert bridge is None
+
+    def test_extract_all___bad_bridge_checksum___raises_and_leaves_no_files(
+        self, tmp_path: Path
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(
+            _create_library_bundle(
+                zipfile.ZIP_DEFLATED, with_jni_bridge=True, bridge_checksum="sha256:00"
+            )
+        )
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="JNI bridge"):
+            loader.extract_all(bundle_path, tmp_path / "out")
+
+        assert list((tmp_path / "out").iterdir()) == []
+
+    @pytest.mark.parametrize("bridge_name", ["libtest.so", "LibTest.so"])
+    def test_extract_all___bridge_with_library_file_name___raises_before_writing(
+        self, tmp_path: Path, bridge_name: str
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(
+            _create_library_bundle(
+                zipfile.ZIP_DEFLATED,
+                with_jni_bridge=True,
+                bridge_path=f"bridge/jni/current/{bridge_name}",
+            )
+        )
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        loader = BundleLoader(verify_signatures=False)
+
+        with pytest.raises(PluginException, match="both extract to"):
+            loader.extract_all(bundle_path, out_dir)
+
+        assert list(out_dir.iterdir()) == []
+
+
+class TestBundleLoaderLibraryCache:
+    """Tests for the content-addressed library cache used by load_with_config."""
+
+    @pytest.fixture
+    def loaded_paths(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record the library paths handed to the native loader instead of loading them."""
+        from rustbridge.native.plugin_loader import NativePluginLoader
+
+        paths: list[str] = []
+
+        def record(path: str, config: object, log_callback: object = None) -> str:
+            paths.append(path)
+            return path
+
+        monkeypatch.setattr(NativePluginLoader, "load_with_config", staticmethod(record))
+        return paths
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_load___cache_dir___reuses_extracted_library(
+        self, tmp_path: Path, loaded_paths: list[str], compression: int
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(compression))
+        loader = BundleLoader(verify_signatures=False, cache_dir=tmp_path / "cache")
+
+        loader.load(bundle_path)
+        first_inode = os.stat(loaded_paths[0]).st_ino
+        loader.load(bundle_path)
+
+        expected = tmp_path / "cache" / hashlib.sha256(LIBRARY_BYTES).hexdigest() / "libtest.so"
+        assert loaded_paths == [str(expected), str(expected)]
+        assert os.stat(loaded_paths[1]).st_ino == first_inode
+        assert expected.read_bytes() == LIBRARY_BYTES
+
+    def test_load___damaged_cache_entry___extracts_again(
+        self, tmp_path: Path, loaded_paths: list[str]
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED))
+        loader = BundleLoader(verify_signatures=False, cache_dir=tmp_path / "cache")
+        loader.load(bundle_path)
+        Path(loaded_paths[0]).write_bytes(b"tampered")
+
+        loader.load(bundle_path)
+
+        assert Path(loaded_paths[1]).read_bytes() == LIBRARY_BYTES
+        assert [p.name for p in Path(loaded_paths[1]).parent.iterdir()] == ["libtest.so"]
+
+    def test_load___cache_dir_and_bad_checksum___raises_and_caches_nothing(
+        self, tmp_path: Path, loaded_paths: list[str]
+    ) -> None:
+        bundle_path = tmp_path / "bundle.rbp"
+        bundle_path.write_bytes(_create_library_bundle(zipfile.ZIP_DEFLATED, checksum="sha256:00"))
+        loader = BundleLoader(verify_signatures=False, cache_dir=tmp_path / "cache")
+
+        with pytest.raises(PluginException, match="Checksum verification failed"):
+            loader.load(bundle_path)
+
+        assert loaded_paths == []
+        assert list((tmp_path / "cache").rglob("*.so*")) == []
+
+    def test_default_cache_dir___xdg_cache_home___is_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert BundleLoader.default_cache_dir() == tmp_path / "rustbridge"
@@ -1,11 +1,13 @@
 """Integration tests with hello-plugin."""
 
 import json
+from ctypes import CFUNCTYPE, POINTER, c_char_p, c_size_t, c_void_p
 from pathlib import Path
 
 import pytest
 
 from rustbridge import (
+    FfiBuffer,
     NativePluginLoader,
     PluginConfig,
     LogLevel,
@@ -116,6 +118,107 @@ class TestHelloPluginIntegration:
             assert isinstance(response, dict)
             assert "message" in response
 
+    def test_call_bytes___echo_message___returns_response_bytes(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            request = json.dumps({"message": "bytes test"}).encode("utf-8")
+
+            response = plugin.call_bytes("echo", request)
+
+            assert isinstance(response, bytes)
+            assert "bytes test" in json.loads(response)["message"]
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_call_bytes___bytes_like_request___returns_response_bytes(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path, wrap: type
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            request = wrap(json.dumps({"message": "buffer test"}).encode("utf-8"))
+
+            response = plugin.call_bytes("echo", request)
+
+            assert "buffer test" in json.loads(response)["message"]
+
+    def test_call_many___echo_messages___returns_responses_in_order(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            requests = [json.dumps({"message": f"batch {i}"}).encode("utf-8") for i in range(5)]
+
+            responses = plugin.call_many("echo", requests)
+
+            assert responses == [plugin.call_bytes("echo", request) for request in requests]
+
+    def test_call_many___after_shutdown___raises_exception(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        plugin = NativePluginLoader.load(str(hello_plugin_path))
+        plugin.shutdown()
+
+        with pytest.raises(PluginException, match="closed"):
+            plugin.call_many("echo", [b'{"message": "test"}'])
+
+    def test_specialize___echo___matches_call(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            echo = plugin.specialize("echo")
+            request = json.dumps({"message": "specialized"})
+
+            response = echo(request)
+
+            assert response == plugin.call("echo", request)
+
+    def test_specialize___after_shutdown___raises_exception(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        plugin = NativePluginLoader.load(str(hello_plugin_path))
+        echo = plugin.specialize("echo")
+        plugin.shutdown()
+
+        with pytest.raises(PluginException, match="closed"):
+            echo('{"message": "test"}')
+
+    def test_warm___then_call___uses_cached_type_tag(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            plugin.warm(["echo"])
+
+            response = plugin.call("echo", json.dumps({"message": "warm"}))
+
+            assert plugin._type_tag_cache == {"echo": b"echo"}
+            assert "warm" in json.loads(response)["message"]
+
+    def test_native_entry_points___call_through_address___matches_call(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        with NativePluginLoader.load(str(hello_plugin_path)) as plugin:
+            entry_points = plugin.native_entry_points()
+            call = CFUNCTYPE(FfiBuffer, c_void_p, c_char_p, c_char_p, c_size_t)(
+                entry_points["plugin_call"]
+            )
+            free = CFUNCTYPE(None, POINTER(FfiBuffer))(entry_points["plugin_free_buffer"])
+            request = json.dumps({"message": "direct"}).encode("utf-8")
+
+            buffer = call(plugin.native_handle, b"echo", request, len(request))
+            try:
+                envelope = json.loads(buffer.get_string())
+            finally:
+                free(buffer)
+
+            assert envelope["payload"] == json.loads(plugin.call("echo", request.decode()))
+
+    def test_native_handle___after_shutdown___raises_exception(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        plugin = NativePluginLoader.load(str(hello_plugin_path))
+        plugin.shutdown()
+
+        with pytest.raises(PluginException, match="closed"):
+            plugin.native_handle  # noqa: B018
+
     def test_load_with_log_callback___callback_invoked(
         self, skip_if_no_plugin: None, hello_plugin_path: Path
     ) -> None:
@@ -23,6 +23,10 @@ class TestLifecycleState:
         with pytest.raises(ValueError, match="Invalid lifecycle state code"):
             LifecycleState.from_code(-1)
 
+    def test_from_code___every_member___returns_same_instance(self) -> None:
+        for member in LifecycleState:
+            assert LifecycleState.from_code(int(member)) is member
+
     def test_can_handle_requests___active___returns_true(self) -> None:
         assert LifecycleState.ACTIVE.can_handle_requests() is True
 
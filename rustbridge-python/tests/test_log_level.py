@@ -23,6 +23,10 @@ class TestLogLevel:
         with pytest.raises(ValueError, match="Invalid log level code"):
             LogLevel.from_code(-1)
 
+    def test_from_code___every_member___returns_same_instance(self) -> None:
+        for member in LogLevel:
+            assert LogLevel.from_code(int(member)) is member
+
     def test_from_string___valid_strings___returns_correct_level(self) -> None:
         assert LogLevel.from_string("trace") == LogLevel.TRACE
         assert LogLevel.from_string("DEBUG") == LogLevel.DEBUG
@@ -1,6 +1,8 @@
 """Tests for MinisignVerifier."""
 
 import base64
+import hashlib
+
 import pytest
 
 from rustbridge import MinisignVerifier
@@ -178,3 +180,115 @@ class TestMinisignVerifierOracleVectors:
         result = verifier.verify(ORACLE_TEST_DATA, tampered_sig)
 
         assert result is False
+
+
+def _sign_minisign(data: bytes, prehashed: bool) -> tuple[str, str]:
+    """Sign data with a fresh key, returning (public_key, signature) in minisign format."""
+    from nacl.signing import SigningKey
+
+    signing_key = SigningKey.generate()
+    key_id = b"\x11\x22\x33\x44\x55\x66\x77\x88"
+    public_key = base64.b64encode(b"Ed" + key_id + bytes(signing_key.verify_key)).decode()
+
+    message = hashlib.blake2b(data, digest_size=64).digest() if prehashed else data
+    algorithm_id = b"ED" if prehashed else b"Ed"
+    raw_signature = signing_key.sign(message).signature
+    encoded = base64.b64encode(algorithm_id + key_id + raw_signature).decode()
+    signature = f"untrusted comment: test\n{encoded}\ntrusted comment: test\n"
+
+    return public_key, signature
+
+
+@pytest.fixture(params=["default", "pynacl"])
+def ed25519_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run a test with the default Ed25519 backend and with the PyNaCl fallback."""
+    if request.param == "pynacl":
+        from rustbridge.core import minisign_verifier
+
+        monkeypatch.setattr(minisign_verifier, "Ed25519PublicKey", None)
+
+
+class TestMinisignVerifierBackends:
+    """Tests that every Ed25519 backend produces the same results."""
+
+    @pytest.mark.parametrize("prehashed", [True, False])
+    def test_verify___buffer_data___returns_true(
+        self, ed25519_backend: None, prehashed: bool
+    ) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, prehashed)
+
+        result = MinisignVerifier(public_key).verify(memoryview(TEST_DATA), signature)
+
+        assert result is True
+
+    @pytest.mark.parametrize("prehashed", [True, False])
+    def test_verify___valid_signature___returns_true(
+        self, ed25519_backend: None, prehashed: bool
+    ) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, prehashed)
+
+        result = MinisignVerifier(public_key).verify(TEST_DATA, signature)
+
+        assert result is True
+
+    @pytest.mark.parametrize("prehashed", [True, False])
+    def test_verify___modified_data___returns_false(
+        self, ed25519_backend: None, prehashed: bool
+    ) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, prehashed)
+
+        result = MinisignVerifier(public_key).verify(TEST_DATA + b"!", signature)
+
+        assert result is False
+
+    def test_verify_prehashed___blake2b_digest___returns_true(self, ed25519_backend: None) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, True)
+        digest = hashlib.blake2b(TEST_DATA, digest_size=64).digest()
+
+        result = MinisignVerifier(public_key).verify_prehashed(digest, signature)
+
+        assert result is True
+
+    def test_verify_prehashed___legacy_signature___returns_false(
+        self, ed25519_backend: None
+    ) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, False)
+        digest = hashlib.blake2b(TEST_DATA, digest_size=64).digest()
+
+        result = MinisignVerifier(public_key).verify_prehashed(digest, signature)
+
+        assert result is False
+
+    @pytest.mark.parametrize("prehashed", [True, False])
+    def test_is_prehashed___signature___reports_algorithm(self, prehashed: bool) -> None:
+        _, signature = _sign_minisign(TEST_DATA, prehashed)
+
+        assert MinisignVerifier.is_prehashed(signature) is prehashed
+
+    def test_verify___oracle_valid_signature___returns_true(self, ed25519_backend: None) -> None:
+        result = MinisignVerifier(ORACLE_PUBLIC_KEY).verify(ORACLE_TEST_DATA, ORACLE_SIGNATURE)
+
+        assert result is True
+
+    def test_verify_many___all_valid___returns_true(self, ed25519_backend: None) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, True)
+        verifier = MinisignVerifier(public_key)
+
+        result = verifier.verify_many([(TEST_DATA, signature), (TEST_DATA, signature)])
+
+        assert result is True
+
+    def test_verify_many___one_modified___returns_false(self, ed25519_backend: None) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, False)
+        verifier = MinisignVerifier(public_key)
+
+        result = verifier.verify_many([(TEST_DATA, signature), (TEST_DATA + b"!", signature)])
+
+        assert result is False
+
+    def test_verify_many___malformed_signature___raises_value_error(self) -> None:
+        public_key, signature = _sign_minisign(TEST_DATA, True)
+        verifier = MinisignVerifier(public_key)
+
+        with pytest.raises(ValueError, match="expected at least 2 lines"):
+            verifier.verify_many([(TEST_DATA, signature), (TEST_DATA, "single line")])
@@ -0,0 +1,91 @@
+"""Tests for NativeLibrary."""
+
+import ctypes
+from pathlib import Path
+
+import pytest
+
+from rustbridge import PluginException, clear_library_cache
+from rustbridge.native import NativeLibrary
+from rustbridge.native import library as library_module
+from rustbridge.native.library import _PLUGIN_CALL, _PLUGIN_FREE_BUFFER, prefetch_library
+
+
+class TestNativeLibrary:
+    """Tests for NativeLibrary."""
+
+    def test_init___nonexistent_path___raises_plugin_exception(self) -> None:
+        with pytest.raises(PluginException, match="Failed to load library"):
+            NativeLibrary("/nonexistent/path/libmissing.so")
+
+    def test_init___same_path_twice___reuses_configured_library(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        first = NativeLibrary(hello_plugin_path)
+
+        second = NativeLibrary(hello_plugin_path)
+
+        assert first._lib is second._lib
+
+    def test_clear_library_cache___after_clear___loads_fresh_library(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        first = NativeLibrary(hello_plugin_path)
+
+        clear_library_cache()
+        second = NativeLibrary(hello_plugin_path)
+
+        assert first._lib is not second._lib
+
+    def test_prefetch___nonexistent_path___raises_on_load(self) -> None:
+        prefetch_library("/nonexistent/path/libprefetch.so")
+
+        with pytest.raises(PluginException, match="Failed to load library"):
+            NativeLibrary("/nonexistent/path/libprefetch.so")
+
+    def test_prefetch___then_load___uses_prefetched_library(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        clear_library_cache()
+        prefetch_library(hello_plugin_path)
+
+        first = NativeLibrary(hello_plugin_path)
+        second = NativeLibrary(hello_plugin_path)
+
+        assert first._lib is second._lib
+
+    def test_init___exported_functions___bound_to_prototypes(
+        self, skip_if_no_plugin: None, hello_plugin_path: Path
+    ) -> None:
+        library = NativeLibrary(hello_plugin_path)
+
+        assert isinstance(library._lib.plugin_call, _PLUGIN_CALL)
+        assert isinstance(library._lib.plugin_free_buffer, _PLUGIN_FREE_BUFFER)
+
+    def test_prototypes___all_functions___release_gil_without_errno_capture(self) -> None:
+        prototypes = {**library_module._REQUIRED_FUNCTIONS, **library_module._OPTIONAL_FUNCTIONS}
+        held_flags = (
+            ctypes._FUNCFLAG_PYTHONAPI
+            | ctypes._FUNCFLAG_USE_ERRNO
+            | ctypes._FUNCFLAG_USE_LASTERROR
+        )
+
+        for name, prototype in prototypes.items():
+            assert prototype._flags_ & held_flags == 0, name
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_plugin_call___bytes_like_request___passed_as_bytes(self, wrap: type) -> None:
+        calls: list[tuple[bytes, bytes, int]] = []
+
+        def plugin_call(handle: object, type_tag: bytes, request: bytes, length: int) -> object:
+            # Same conversion the c_char_p argument of the real prototype applies
+            ctypes.c_char_p.from_param(request)
+            calls.append((type_tag, request, length))
+            return None
+
+        library = NativeLibrary.__new__(NativeLibrary)
+        library._plugin_call = plugin_call
+
+        library.plugin_call(None, "echo", wrap(b'{"message": "hi"}'))
+
+        assert calls == [(b"echo", b'{"message": "hi"}', 17)]
@@ -0,0 +1,59 @@
+"""Tests for the rustbridge package namespace."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import rustbridge
+
+PACKAGE_ROOT = Path(__file__).parent.parent
+
+
+def _run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter so module import state is not shared."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestPackage:
+    """Tests for the top-level package."""
+
+    def test_version___matches_pyproject(self) -> None:
+        pyproject = (PACKAGE_ROOT / "pyproject.toml").read_text(encoding="utf-8")
+        match = re.search(r'^version = "([^"]+)"', pyproject, re.MULTILINE)
+
+        assert match is not None
+        assert rustbridge.__version__ == match.group(1)
+
+    def test_all___every_name___is_importable(self) -> None:
+        for name in rustbridge.__all__:
+            assert getattr(rustbridge, name) is not None
+
+    def test_getattr___unknown_name___raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            rustbridge.no_such_name  # noqa: B018
+
+    def test_dir___includes_public_names(self) -> None:
+        assert set(rustbridge.__all__) <= set(dir(rustbridge))
+
+    def test_import___light_type___does_not_load_heavy_modules(self) -> None:
+        output = _run_isolated(
+            "import sys; from rustbridge import LogLevel; "
+            "print(any(m.startswith(('nacl', 'rustbridge.native', "
+            "'rustbridge.core.bundle_loader')) for m in sys.modules))"
+        )
+
+        assert output == "False"
+
+    def test_all___is_tuple_without_duplicates(self) -> None:
+        assert isinstance(rustbridge.__all__, tuple)
+        assert len(set(rustbridge.__all__)) == len(rustbridge.__all__)
@@ -5,6 +5,7 @@ import json
 import pytest
 
 from rustbridge import PluginConfig, LogLevel
+from rustbridge.core import _json
 
 
 class TestPluginConfig:
@@ -100,3 +101,44 @@ class TestPluginConfig:
         assert parsed["data"]["custom"] == "value"
         assert parsed["max_concurrent_ops"] == 1000
         assert parsed["shutdown_timeout_ms"] == 5000
+
+    def test_to_json_bytes___values_json_accepts___match_stdlib(self) -> None:
+        config = (
+            PluginConfig.defaults()
+            .set("int_keys", {1: "one"})
+            .set("big", 2**70)
+            .init_param("name", "tëst")
+        )
+
+        parsed = json.loads(config.to_json_bytes())
+
+        assert parsed == json.loads(json.dumps(config.to_dict()))
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_json_bytes___with_or_without_orjson___same_compact_utf8(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        config = PluginConfig().set("name", "tëst")
+
+        data = config.to_json_bytes()
+
+        assert b", " not in data
+        assert '"name":"tëst"'.encode() in data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_json_bytes___nan_value___raises_value_error(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        config = PluginConfig().set("ratio", float("nan"))
+
+        with pytest.raises(ValueError):
+            config.to_json_bytes()
+
+    def test_instance___has_no_instance_dict(self) -> None:
+        config = PluginConfig.defaults()
+
+        assert not hasattr(config, "__dict__")
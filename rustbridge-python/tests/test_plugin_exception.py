@@ -0,0 +1,27 @@
+"""Tests for PluginException."""
+
+import pickle
+
+from rustbridge import PluginException
+
+
+class TestPluginException:
+    """Tests for PluginException."""
+
+    def test_str___fields_changed_after_str___reflects_changes(self) -> None:
+        exc = PluginException("boom", 7)
+        str(exc)
+
+        exc.message = "bang"
+        exc.error_code = 8
+
+        assert str(exc) == "[8] bang"
+
+    def test_pickle___formatted___keeps_error_code(self) -> None:
+        exc = PluginException("boom", 7)
+        str(exc)
+
+        restored = pickle.loads(pickle.dumps(exc))
+
+        assert restored.error_code == 7
+        assert str(restored) == "[7] boom"
@@ -0,0 +1,198 @@
+"""Tests for ResponseEnvelope."""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+
+import pytest
+
+from rustbridge import PluginException, ResponseEnvelope
+from rustbridge.core import _json
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class TestResponseEnvelope:
+    """Tests for ResponseEnvelope."""
+
+    def test_from_json___success_response___parses_payload(self) -> None:
+        envelope = ResponseEnvelope.from_json(
+            '{"status": "success", "payload": {"message": "hi"}, "request_id": 7}'
+        )
+
+        assert envelope.is_success
+        assert envelope.payload == {"message": "hi"}
+        assert envelope.request_id == 7
+
+    def test_from_json___error_response___parses_error(self) -> None:
+        envelope = ResponseEnvelope.from_json(
+            '{"status": "error", "error_code": 6, "error_message": "unknown message type"}'
+        )
+
+        assert not envelope.is_success
+        assert envelope.error_code == 6
+        assert envelope.error_message == "unknown message type"
+
+    def test_from_json___invalid_json___raises_exception(self) -> None:
+        with pytest.raises(PluginException, match="Failed to parse response JSON"):
+            ResponseEnvelope.from_json("not valid json")
+
+    def test_from_bytes___utf8_bytes___parses_payload(self) -> None:
+        data = json.dumps({"status": "success", "payload": "héllo"}).encode("utf-8")
+
+        envelope = ResponseEnvelope.from_bytes(data)
+
+        assert envelope.payload == "héllo"
+
+    def test_get_payload_json___no_payload___returns_null(self) -> None:
+        envelope = ResponseEnvelope(status="success")
+
+        assert envelope.get_payload_json() == "null"
+
+    def test_get_payload_json___with_payload___round_trips(self) -> None:
+        envelope = ResponseEnvelope(status="success", payload={"a": [1, 2]})
+
+        assert json.loads(envelope.get_payload_json()) == {"a": [1, 2]}
+
+    def test_get_payload_bytes___no_payload___returns_null(self) -> None:
+        envelope = ResponseEnvelope(status="success")
+
+        assert envelope.get_payload_bytes() == b"null"
+
+    def test_get_payload_bytes___with_payload___round_trips(self) -> None:
+        envelope = ResponseEnvelope(status="success", payload={"a": [1, 2], "b": "héllo"})
+
+        assert json.loads(envelope.get_payload_bytes()) == {"a": [1, 2], "b": "héllo"}
+
+    def test_get_payload_bytes___int_beyond_64_bits___round_trips(self) -> None:
+        envelope = ResponseEnvelope(status="success", payload={"n": 2**70})
+
+        assert json.loads(envelope.get_payload_bytes()) == {"n": 2**70}
+        assert json.loads(envelope.get_payload_json()) == {"n": 2**70}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_get_payload_bytes___with_or_without_orjson___same_compact_utf8(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        envelope = ResponseEnvelope(
+            status="success", payload={"a": [1, 2.5, None], "b": "héllo", "c": {"d": True}}
+        )
+
+        data = envelope.get_payload_bytes()
+
+        assert data == b'{"a":[1,2.5,null],"b":"h\xc3\xa9llo","c":{"d":true}}'
+        assert envelope.get_payload_json() == data.decode("utf-8")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "value", [_Point(1, 2), datetime.datetime(2026, 1, 30), datetime.date(2026, 1, 30)]
+    )
+    def test_get_payload_bytes___dataclass_or_datetime___raises_type_error(
+        self, use_orjson: bool, value: object, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        envelope = ResponseEnvelope(status="success", payload={"x": value})
+
+        with pytest.raises(TypeError):
+            envelope.get_payload_bytes()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_get_payload_bytes___uuid_and_enum___written_as_values(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        envelope = ResponseEnvelope(
+            status="success", payload={"id": uuid.UUID(int=1), "color": _Color.RED, 2: "b"}
+        )
+
+        data = envelope.get_payload_bytes()
+
+        assert data == b'{"id":"00000000-0000-0000-0000-000000000001","color":"red","2":"b"}'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("number", [float("nan"), float("inf"), float("-inf")])
+    def test_get_payload_bytes___non_finite_float___raises_value_error(
+        self, use_orjson: bool, number: float, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(_json, "_orjson_dumps", None)
+        envelope = ResponseEnvelope(status="success", payload={"x": [number]})
+
+        with pytest.raises(ValueError):
+            envelope.get_payload_bytes()
+        with pytest.raises(ValueError):
+            envelope.get_payload_json()
+
+    def test_parse_payload___success_response___returns_payload(self) -> None:
+        data = json.dumps({"status": "success", "payload": {"a": [1, 2]}}).encode("utf-8")
+
+        payload = ResponseEnvelope.parse_payload(data)
+
+        assert payload == {"a": [1, 2]}
+
+    def test_parse_payload___memoryview___returns_payload(self) -> None:
+        data = json.dumps({"status": "success", "payload": "héllo"}).encode("utf-8")
+
+        payload = ResponseEnvelope.parse_payload(memoryview(data))
+
+        assert payload == "héllo"
+
+    @pytest.mark.parametrize("wrap", [str, bytes, bytearray, memoryview])
+    def test_parse_payload___128_bit_integers___keeps_exact_values(self, wrap: type) -> None:
+        text = (
+            '{"status": "success", "payload": '
+            '{"id": 340282366920938463463374607431768211455, '
+            '"min": -170141183460469231731687303715884105728}}'
+        )
+        data = text if wrap is str else wrap(text.encode("utf-8"))
+
+        payload = ResponseEnvelope.parse_payload(data)
+
+        assert payload == {"id": 2**128 - 1, "min": -(2**127)}
+        assert isinstance(payload["id"], int)
+
+    def test_parse_payload___error_response___raises_exception(self) -> None:
+        data = json.dumps({"status": "error", "error_code": 3, "error_message": "boom"})
+
+        with pytest.raises(PluginException, match="boom") as exc_info:
+            ResponseEnvelope.parse_payload(data)
+
+        assert exc_info.value.error_code == 3
+
+    def test_parse_payload___invalid_json___raises_exception(self) -> None:
+        with pytest.raises(PluginException, match="Failed to parse response JSON"):
+            ResponseEnvelope.parse_payload("not json")
+
+    @pytest.mark.parametrize("digits", [b"", b"1" * 20])
+    def test_parse_payload___nan_literal___raises_exception(self, digits: bytes) -> None:
+        data = b'{"status": "success", "payload": [NaN], "n": 1%s}' % digits
+
+        with pytest.raises(PluginException, match="Failed to parse response JSON"):
+            ResponseEnvelope.parse_payload(data)
+
+    def test_unwrap___error_response___raises_exception(self) -> None:
+        envelope = ResponseEnvelope(status="error", error_code=3, error_message="boom")
+
+        with pytest.raises(PluginException, match="boom") as exc_info:
+            envelope.unwrap()
+
+        assert exc_info.value.error_code == 3
+
+    def test_instance___has_no_instance_dict(self) -> None:
+        envelope = ResponseEnvelope(status="success")
+
+        assert not hasattr(envelope, "__dict__")
@@ -0,0 +1,49 @@
+"""Tests for FFI structures."""
+
+import ctypes
+from ctypes import POINTER, c_uint8
+
+from rustbridge import FfiBuffer
+
+
+def _make_buffer(data: bytes) -> tuple[FfiBuffer, ctypes.Array]:
+    """Create an FfiBuffer over a Python-owned array (returned to keep it alive)."""
+    array = (c_uint8 * len(data))(*data)
+    buffer = FfiBuffer(ctypes.cast(array, POINTER(c_uint8)), len(data), len(data), 0)
+    return buffer, array
+
+
+class TestFfiBuffer:
+    """Tests for FfiBuffer."""
+
+    def test_get_bytes___with_data___returns_copy(self) -> None:
+        buffer, array = _make_buffer(b"hello")
+
+        result = buffer.get_bytes()
+        array[0] = ord("j")
+
+        assert result == b"hello"
+
+    def test_get_bytes___empty___returns_empty_bytes(self) -> None:
+        buffer = FfiBuffer()
+
+        assert buffer.get_bytes() == b""
+
+    def test_get_string___utf8_data___decodes(self) -> None:
+        buffer, _array = _make_buffer(b"h\xc3\xa9llo w\xc3\xb6rld")
+
+        assert buffer.get_string() == "héllo wörld"
+
+    def test_as_memoryview___with_data___views_native_memory(self) -> None:
+        buffer, array = _make_buffer(b"hello")
+
+        view = buffer.as_memoryview()
+        array[0] = ord("j")
+
+        assert view.readonly
+        assert bytes(view) == b"jello"
+
+    def test_as_memoryview___empty___returns_empty_view(self) -> None:
+        buffer = FfiBuffer()
+
+        assert len(buffer.as_memoryview()) == 0